@@ -26,25 +26,34 @@ def prompt_for_letter(used_letters):
             continue
         return guess
     
-def reveal_letters(word, blanks, letter):
+def letter_positions(word):
     """
-    Replace matching blanks with the guessed letter.
-    Returns True if at least one letter was revealed; otherwise False.
+    Map every letter of the word to the indexes where it appears.
+    Built once per game so each guess only touches its own matches.
     """
-    found_any = False
+    positions = {}
     for i, ch in enumerate(word):
-        if ch == letter and blanks[i] == "_":
-            blanks[i] = letter
-            found_any = True
-    return found_any
+        positions.setdefault(ch, []).append(i)
+    return positions
+
+def reveal(positions, blanks, letter):
+    """
+    Replace matching blanks with the guessed letter.
+    Returns the number of letters revealed (0 if the letter is not in the word).
+    """
+    idxs = positions.get(letter)
+    if not idxs:
+        return 0
+    for i in idxs:
+        blanks[i] = letter
+    return len(idxs)
 
-def all_blanks_filled(blanks):
-    """Check win condition."""
-    return "_" not in blanks
 def play_game(max_lives=6):
     """Main game loop following the provided algorithm."""
     secret = gen_word()
     blanks = gen_blank(secret)
+    positions = letter_positions(secret)
+    remaining = len(secret)
     lives = max_lives
     used = set()
     secret_size = len(secret)   
@@ -56,11 +65,13 @@ def play_game(max_lives=6):
         guess = prompt_for_letter(used)
         used.add(guess) 
         # Is the guessed letter in the word?    
-        if reveal_letters(secret, blanks, guess):
+        found = reveal(positions, blanks, guess)
+        if found:
+            remaining -= found
             print("\n Well done, Nice job! You found a letter.")
             print(" ".join(blanks))
             # Are all blanks filled?
-            if all_blanks_filled(blanks):
+            if remaining == 0:
                 print("\n Congratulation! You guessed the word!")
                 print(f"Word: {secret}")
                 print("GAME OVER")
@@ -27,33 +27,34 @@ def prompt_for_letter(used_letters):
         return guess
     
 class SecretWords:
-    def __init__(self, word, blanks, letter):
+    def __init__(self, word):
         self.word = word
-        self.blanks = blanks
-        self.letter = letter
+        # Index every letter's positions once so a guess is a single dict lookup
+        self.positions = {}
+        for i, ch in enumerate(word):
+            self.positions.setdefault(ch, []).append(i)
 
-    def reveal_letters(self, word, blanks, letter):
+    def reveal_letters(self, blanks, letter):
         """
         Replace matching blanks with the guessed letter.
-        Returns True if at least one letter was revealed; otherwise False.
+        Returns the number of letters revealed (0 if the letter is not in the word).
         """
-        found_any = False
-        for i, ch in enumerate(word):
-            if ch == letter and blanks[i] == "_":
-                blanks[i] = letter
-                found_any = True
-        return found_any
+        idxs = self.positions.get(letter)
+        if not idxs:
+            return 0
+        for i in idxs:
+            blanks[i] = letter
+        return len(idxs)
 
-def all_blanks_filled(blanks):
-    """Check win condition."""
-    return "_" not in blanks
 class Play_Game:
     def __init__(self):
         pass 
-    def play_game(max_lives=6):
+    def play_game(self, max_lives=6):
         """Main game loop following the provided algorithm."""
         secret = gen_word()
         blanks = gen_blank(secret)
+        secretwords = SecretWords(secret)
+        remaining = len(secret)
         lives = max_lives
         used = set()
         secret_size = len(secret)   
@@ -66,14 +67,14 @@ class Play_Game:
             used.add(guess) 
             # Is the guessed letter in the word?    
             # EPI start change to test for class
-            secretwords = SecretWords(secret, blanks, guess)
-            #if reveal_letters(secret, blanks, guess):
-            if secretwords.reveal_letters(secret, blanks, guess):
+            found = secretwords.reveal_letters(blanks, guess)
+            if found:
             # EPI end change to test for class
+                remaining -= found
                 print("\n Well done, Nice job! You found a letter.")
                 print(" ".join(blanks))
                 # Are all blanks filled?
-                if all_blanks_filled(blanks):
+                if remaining == 0:
                     print("\n Congratulation! You guessed the word!")
                     print(f"Word: {secret}")
                     print("GAME OVER")
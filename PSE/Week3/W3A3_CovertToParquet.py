@@ -21,79 +21,99 @@ NCP	Feature	Continuous		How many main meals do you have daily?		no
 CAEC	Feature	Categorical		Do you eat any food between meals?		no
 SMOKE	Feature	Binary		Do you smoke?		no
 """
-import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pv
 import pyarrow.parquet as pq
 
+# Every numeric column is pinned so a later block cannot infer a different type
+# (e.g. FCVC is int64 in the first block but holds fractions in the synthetic rows).
+NUMERIC_COLUMNS = {col: pa.float64() for col in
+                   ("Age", "Height", "Weight", "FCVC", "NCP", "CH2O", "FAF", "TUE")}
+ROW_GROUP_SIZE = 64 * 1024
+
 class DataFrameConverter:
     def __init__(self):
         """
         Initializes the DataFrameConverter.
         """
-        self.dataframe = None
         print("DataFrameConverter initialized. Ready for data operations.")
 
-    def read_data(self, input_file_path):
-        try:
-            self.dataframe = pd.read_csv(input_file_path)   
-            print("Data loaded successfully into DataFrame.")
-            print(f"DataFrame shape: {self.dataframe.shape}")
-            print("First 5 rows:\n", self.dataframe.head())
-            return self.dataframe
-        except Exception as e:
-            print(f"Error reading data: {e}")
-            self.dataframe = None # Reset dataframe if reading fails
-            return None
-        
-    def convert_to_parquet(self,output_parquet_file):
+    def convert(self, input_file_path, output_parquet_file):
+        """
+        Streams the CSV into a Parquet file one batch at a time and computes
+        the column summary in the same pass. Returns the summary dict, or None
+        if the conversion failed.
+        """
         try:
-            # Use engine='pyarrow' for robust Parquet writing.
-            # For large datasets, consider compression (e.g., compression='snappy', 'gzip', 'brotli')
-            self.dataframe.to_parquet(output_parquet_file, engine='pyarrow', index=False)
+            reader = pv.open_csv(
+                input_file_path,
+                read_options=pv.ReadOptions(block_size=1 << 20),
+                convert_options=pv.ConvertOptions(column_types=NUMERIC_COLUMNS),
+            )
+            stats = {"rows": 0, "max_age": None, "min_ht": None, "sum_wt": 0.0, "smokers": 0}
+            with pq.ParquetWriter(output_parquet_file, reader.schema,
+                                  compression="zstd", compression_level=3,
+                                  use_dictionary=True, data_page_size=1 << 20) as writer:
+                # CSV batches are ~8K rows; hold them until a full row group is ready
+                pending, pending_rows = [], 0
+                for batch in reader:
+                    pending.append(batch)
+                    pending_rows += batch.num_rows
+                    if pending_rows >= ROW_GROUP_SIZE:
+                        table = pa.Table.from_batches(pending)
+                        while table.num_rows >= ROW_GROUP_SIZE:
+                            writer.write_table(table.slice(0, ROW_GROUP_SIZE), row_group_size=ROW_GROUP_SIZE)
+                            table = table.slice(ROW_GROUP_SIZE)
+                        pending, pending_rows = table.to_batches(), table.num_rows
+                    stats["rows"] += batch.num_rows
+                    age = pc.max(batch.column("Age")).as_py()
+                    ht = pc.min(batch.column("Height")).as_py()
+                    if age is not None and (stats["max_age"] is None or age > stats["max_age"]):
+                        stats["max_age"] = age
+                    if ht is not None and (stats["min_ht"] is None or ht < stats["min_ht"]):
+                        stats["min_ht"] = ht
+                    stats["sum_wt"] += pc.sum(batch.column("Weight")).as_py() or 0.0
+                    stats["smokers"] += pc.sum(pc.equal(batch.column("SMOKE"), "yes")).as_py() or 0
+                if pending:
+                    writer.write_table(pa.Table.from_batches(pending), row_group_size=ROW_GROUP_SIZE)
             print("Conversion to Parquet successful!")
-            return True
+            return stats
         except Exception as e:
             print(f"Error during Parquet conversion: {e}")
-            return False
+            return None
 
 
 
 def main():
-    input_csv_file = "ObesityDataSet.csv"
-    output_parquet_file = "ObesityDataSet.parquet"
     input_file_path = r"G:\My Drive\00_Pers\000_MSE800\PSE\Week3\ObesityDataSet.csv"
     output_parquet_file= r"G:\My Drive\00_Pers\000_MSE800\PSE\Week3\ObesityDataSet.parquet"
     csvtoparquet = DataFrameConverter()
-    panda_var = csvtoparquet.read_data(input_file_path)
-    
-    if panda_var is not None:
-        conversion_success = csvtoparquet.convert_to_parquet(output_parquet_file)
-        if conversion_success:
-            print(f"\nSuccessfully converted '{input_csv_file}' to '{output_parquet_file}'.")
-            # Optional: Verify the Parquet file
-            print("\n--- Verifying Parquet File ---")
-            try:
-                parquet_data = pd.read_parquet(output_parquet_file, engine='pyarrow')
-                print(f"Parquet file loaded successfully. Shape: {parquet_data.shape}")
-                #print("First 5 rows from Parquet:\n", paraquet_data.head())
-                max_age = parquet_data['Age'].max()
-                min_ht = parquet_data['Height'].min()
-                avg_wt = round(parquet_data['Weight'].mean(),2)
-                #abs_val = parquet_data['Weight'].max().abs()
-                match_rec = parquet_data[parquet_data['SMOKE'] == "yes"]
-                count_rec = len(match_rec)
-                print("Highest Age for participants of the study is: ", max_age)
-                print("Lowest Height of a participant that joined the study is: ", min_ht)
-                print("Average Weight of a participant that joined the study is: ", avg_wt)
-                print("No Absolute Value for any of the columns. ")
-                print("Number of people who are Smokers: ", count_rec)
+    stats = csvtoparquet.convert(input_file_path, output_parquet_file)
 
-                #max_age_mae = 
+    if stats is not None:
+        print(f"\nSuccessfully converted '{input_file_path}' to '{output_parquet_file}'.")
+        # Optional: Verify the Parquet file from its footer only
+        print("\n--- Verifying Parquet File ---")
+        try:
+            metadata = pq.read_metadata(output_parquet_file)
+            print(f"Parquet file loaded successfully. Shape: ({metadata.num_rows}, {metadata.num_columns})")
+            if metadata.num_rows == stats["rows"]:
+                print(f"Row count matches the CSV: {stats['rows']} rows.")
+            else:
+                print(f"Row count mismatch: CSV had {stats['rows']} rows, Parquet file has {metadata.num_rows}.")
+            # the figures below were computed from the CSV while it was being converted
+            print("\n--- CSV Column Stats (computed during conversion) ---")
+            avg_wt = round(stats["sum_wt"] / stats["rows"], 2) if stats["rows"] else 0
+            print("Highest Age for participants of the study is: ", stats["max_age"])
+            print("Lowest Height of a participant that joined the study is: ", stats["min_ht"])
+            print("Average Weight of a participant that joined the study is: ", avg_wt)
+            print("No Absolute Value for any of the columns. ")
+            print("Number of people who are Smokers: ", stats["smokers"])
 
-            except Exception as e:
-                print(f"Error verifying Parquet file: {e}")
-        else:
-            print(f"\nFailed to convert '{input_file_path}' to Parquet.")
+        except Exception as e:
+            print(f"Error verifying Parquet file: {e}")
     else:
-        print("\nSkipping Parquet conversion due to data reading failure.")
+        print(f"\nFailed to convert '{input_file_path}' to Parquet.")
 if __name__ == "__main__":
     main()
\ No newline at end of file
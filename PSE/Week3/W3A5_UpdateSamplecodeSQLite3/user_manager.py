@@ -1,16 +1,21 @@
 from database import create_connection
 import sqlite3
 
-def add_user(name, email):
+def bulk_add_users(rows):
+    """Insert many (name, email) rows in a single transaction."""
     conn = create_connection()
-    cursor = conn.cursor()
     try:
-        cursor.execute("INSERT INTO users (name, email) VALUES (?, ?)", (name, email))
-        conn.commit()
+        with conn:
+            conn.executemany("INSERT INTO users (name, email) VALUES (?, ?)", rows)
+    finally:
+        conn.close()
+
+def add_user(name, email):
+    try:
+        bulk_add_users([(name, email)])
         print(" User added successfully.")
     except sqlite3.IntegrityError:
         print(" Email must be unique.")
-    conn.close()
 
 def view_users():
     conn = create_connection()
@@ -37,16 +42,21 @@ def delete_user(user_id):
     print("🗑️ User deleted.")
 
 # Start EJP W3A5
-def add_Student(name, address):
+def bulk_add_students(rows):
+    """Insert many (name, address) rows in a single transaction."""
     conn = create_connection()
-    cursor = conn.cursor()
     try:
-        cursor.execute("INSERT INTO Students (Stu_name, Stu_address) VALUES (?, ? )", (name, address))
-        conn.commit()
+        with conn:
+            conn.executemany("INSERT INTO Students (Stu_name, Stu_address) VALUES (?, ?)", rows)
+    finally:
+        conn.close()
+
+def add_Student(name, address):
+    try:
+        bulk_add_students([(name, address)])
         print(" User added successfully.")
     except sqlite3.IntegrityError:
         print(" Email must be unique.")
-    conn.close()
 
 def view_Students():
     conn = create_connection()
@@ -7,67 +7,170 @@ YSDatabase.py - Week 3 Activity 6 - W3A6 - EJI
 Eduardo JR Ilagan
 """
 
+import atexit
 import sqlite3
+from contextlib import contextmanager
+from datetime import datetime
+
+_initialized = False
+_conn = None
+FETCH_SIZE = 256
 
 def create_connection():
-    conn = sqlite3.connect("YSDDB.db")
+    global _initialized
+    conn = sqlite3.connect("YSDDB.db", cached_statements=128)
+    # journal_mode is stored in the database file, so it only needs setting once
+    if not _initialized:
+        conn.execute("PRAGMA journal_mode=WAL")
+        _initialized = True
+    # These are per-connection settings
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA temp_store=MEMORY")
+    conn.execute("PRAGMA cache_size=-64000")
+    conn.execute("PRAGMA foreign_keys=ON")
     return conn
 
+def get_conn():
+    """Returns the shared connection, opening it on first use.
+    The CLI is single-threaded so one connection is reused for the whole session."""
+    global _conn
+    if _conn is None:
+        _conn = create_connection()
+        atexit.register(_conn.close)
+    return _conn
+
+@contextmanager
+def menu_session():
+    """Keeps everything done in one menu visit in a single transaction,
+    committed when the menu is left. It is committed even if the visit ends
+    in an error: each add/delete already undid itself through savepoint(), so
+    only actions the user was told had succeeded are left to keep."""
+    conn = get_conn()
+    if not conn.in_transaction:
+        conn.execute("BEGIN")
+    try:
+        yield conn
+    finally:
+        conn.commit()
+
+@contextmanager
+def savepoint(conn):
+    """Makes one add/delete all-or-nothing without committing, so it can sit
+    inside a menu_session transaction. Outside of one it commits on release."""
+    conn.execute("SAVEPOINT action")
+    try:
+        yield conn
+    except BaseException:
+        conn.execute("ROLLBACK TO action")
+        conn.execute("RELEASE action")
+        raise
+    conn.execute("RELEASE action")
+
+def iter_rows(cursor, size=FETCH_SIZE):
+    """Yields the rows of an executed cursor one fetchmany batch at a time,
+    so only a single batch is held in memory."""
+    while True:
+        batch = cursor.fetchmany(size)
+        if not batch:
+            return
+        yield from batch
+
+"""Adds the pd_date_int column (the payment date as a proleptic Gregorian ordinal,
+the same number date.toordinal() gives) to payments tables created before it
+existed, fills it in for the old rows, and indexes it with stu_id"""
+def _add_pay_date_int(cursor):
+    columns = {row[1] for row in cursor.execute("PRAGMA table_info(payments)")}
+    if "pd_date_int" not in columns:
+        cursor.execute("ALTER TABLE payments ADD COLUMN pd_date_int INTEGER")
+    # strptime rather than SQLite's date functions, as older versions accepted unpadded dates like 2025-4-5
+    backfill = []
+    for tran_id, pd_date in cursor.execute("SELECT tran_id, pd_date FROM payments WHERE pd_date_int IS NULL").fetchall():
+        try:
+            backfill.append((datetime.strptime(pd_date, "%Y-%m-%d").toordinal(), tran_id))
+        except ValueError:
+            pass
+    cursor.executemany("UPDATE payments SET pd_date_int = ? WHERE tran_id = ?", backfill)
+    cursor.execute("DROP INDEX IF EXISTS idx_pay_stu")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_pay_stu_date ON payments (stu_id, pd_date_int)")
+
+"""Renames tables whose FOREIGN KEYs point at tables that do not exist
+(created by older versions of create_tables) so they can be rebuilt"""
+def _rename_stale_tables(cursor):
+    tables = {row[0] for row in cursor.execute("SELECT name FROM sqlite_master WHERE type = 'table'")}
+    stale = []
+    for table in ("subjects", "class_records"):
+        if table not in tables:
+            continue
+        targets = {row[2] for row in cursor.execute(f"PRAGMA foreign_key_list({table})")}
+        if not targets <= tables:
+            cursor.execute(f"ALTER TABLE {table} RENAME TO {table}_old")
+            stale.append(table)
+    return stale
+
 def create_tables():
     conn = create_connection()
+    # Keep FK checks and reference rewriting out of the way while old tables are rebuilt
+    conn.execute("PRAGMA foreign_keys=OFF")
+    conn.execute("PRAGMA legacy_alter_table=ON")
     cursor = conn.cursor()
-    """Creates the table for Students"""
-    cursor.execute('''
+    stale = _rename_stale_tables(cursor)
+    """Creates all the tables and their indexes in a single transaction"""
+    conn.executescript('''
+        BEGIN;
         CREATE TABLE IF NOT EXISTS students (
             stu_id INTEGER PRIMARY KEY AUTOINCREMENT,
             stu_name TEXT NOT NULL,
             stu_addr TEXT NOT NULL
-        )
-    ''')
-    cursor.execute('''
+        );
         CREATE TABLE IF NOT EXISTS payments (
             tran_id INTEGER PRIMARY KEY AUTOINCREMENT,
             stu_id INTEGER NOT NULL,
             amount INTEGER NOT NULL,
             pd_date TEXT NOT NULL,
+            pd_date_int INTEGER,
             FOREIGN KEY (stu_id) references students (stu_id)
-        )
-    ''')
-    cursor.execute('''
+        );
         CREATE TABLE IF NOT EXISTS instructors (
             inst_id INTEGER PRIMARY KEY AUTOINCREMENT,
             inst_name TEXT NOT NULL
-        )
-    ''')
-    cursor.execute('''
+        );
         CREATE TABLE IF NOT EXISTS courses (
             crse_id INTEGER PRIMARY KEY AUTOINCREMENT,
             crse_name TEXT NOT NULL,
             crse_timeframe TEXT NOT NULL
-        )
-    ''')
-    cursor.execute('''
+        );
         CREATE TABLE IF NOT EXISTS subjects (
             sbjt_id INTEGER PRIMARY KEY AUTOINCREMENT,
             sbjt_name TEXT NOT NULL,
             sbjt_sched TEXT NOT NULL,
             crse_id INTEGER NOT NULL,
             inst_id INTEGER NOT NULL,
-            FOREIGN KEY (crse_id) references course (crse_id),
-            FOREIGN KEY (inst_id) references course (inst_id)
-        )
-    ''')
-    cursor.execute('''
+            FOREIGN KEY (crse_id) references courses (crse_id),
+            FOREIGN KEY (inst_id) references instructors (inst_id)
+        );
         CREATE TABLE IF NOT EXISTS class_records (
             sbjt_id INTEGER NOT NULL,
             stu_id INTEGER NOT NULL,
             inst_id INTEGER NOT NULL,
             marking TEXT,
             PRIMARY KEY (stu_id,sbjt_id,inst_id) 
-            FOREIGN KEY (stu_id) references student (stu_id),
-            FOREIGN KEY (inst_id) references instsructor (inst_id),
-            FOREIGN KEY (sbjt_id) references subject (sbjt_id)
-        )
+            FOREIGN KEY (stu_id) references students (stu_id),
+            FOREIGN KEY (inst_id) references instructors (inst_id),
+            FOREIGN KEY (sbjt_id) references subjects (sbjt_id)
+        );
+        CREATE INDEX IF NOT EXISTS idx_clsrec_inst ON class_records (inst_id);
+        CREATE INDEX IF NOT EXISTS idx_clsrec_sbjt ON class_records (sbjt_id);
+        CREATE INDEX IF NOT EXISTS idx_sbjt_crse ON subjects (crse_id);
+        CREATE INDEX IF NOT EXISTS idx_sbjt_inst ON subjects (inst_id);
+        CREATE INDEX IF NOT EXISTS idx_stu_name ON students (stu_name COLLATE NOCASE);
+        CREATE INDEX IF NOT EXISTS idx_sbjt_name ON subjects (sbjt_name COLLATE NOCASE, crse_id, inst_id, sbjt_sched);
+        COMMIT;
     ''')
+    """Copies the rows of any rebuilt table back in"""
+    for table in stale:
+        cursor.execute(f"INSERT INTO {table} SELECT * FROM {table}_old")
+        cursor.execute(f"DROP TABLE {table}_old")
+    _add_pay_date_int(cursor)
+    cursor.execute("ANALYZE")
     conn.commit()
     conn.close()
\ No newline at end of file
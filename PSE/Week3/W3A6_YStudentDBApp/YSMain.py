@@ -7,42 +7,44 @@ YSMain.py - Week 3 Activity 6 - W3A6 - EJI
 Eduardo JR Ilagan
 """
 
-from YSDatabase import create_tables
-from YSstu_manager import menu_01_stu
-from YSinst_manager import menu_02_inst
-from YScrse_manager import menu_03_crse
-from YSsbjt_manager import menu_04_sbjt
-from YSpay_manager import menu_05_pay
-from YSclsrec_manager import menu_06_clsrec
+import importlib
+import sys
+from YSDatabase import create_tables,menu_session
+
+"""Main Menu option -> (module, sub menu). Modules are only imported when their menu is first opened"""
+MENU_0_ACTIONS = {
+    "1": ("YSstu_manager", "menu_01_stu"),
+    "2": ("YSinst_manager", "menu_02_inst"),
+    "3": ("YScrse_manager", "menu_03_crse"),
+    "4": ("YSsbjt_manager", "menu_04_sbjt"),
+    "5": ("YSpay_manager", "menu_05_pay"),
+    "6": ("YSclsrec_manager", "menu_06_clsrec"),
+}
+
+MENU_0_BANNER = ("\n========= Yoobee Student Database =========\n"
+                 "1. Students\n"
+                 "2. Instructor\n"
+                 "3. Course\n"
+                 "4. Subject\n"
+                 "5. Payment Records\n"
+                 "6. Class Records\n"
+                 "7. Exit\n")
 
 """Function for Main Menu"""
 def menu_0():
-    print("1. Students")
-    print("2. Instructor")
-    print("3. Course")
-    print("4. Subject")
-    print("5. Payment Records")
-    print("6. Class Records")
-    print("7. Exit")
+    sys.stdout.write(MENU_0_BANNER)
 
 def main():
     create_tables()
     while True:
-        print("\n========= Yoobee Student Database =========")
         menu_0()
         m0_choice = input("Select an option (1-7): ")
-        if m0_choice == "1":
-            menu_01_stu()
-        elif m0_choice == "2":
-            menu_02_inst()
-        elif m0_choice == "3":
-            menu_03_crse()
-        elif m0_choice == "4":
-            menu_04_sbjt()
-        elif m0_choice == "5":
-            menu_05_pay()
-        elif m0_choice == "6":
-            menu_06_clsrec()
+        menu = MENU_0_ACTIONS.get(m0_choice)
+        if menu:
+            module_name, menu_name = menu
+            # everything done in the sub menu is committed once, when it is left (even on an error)
+            with menu_session():
+                getattr(importlib.import_module(module_name), menu_name)()
         elif m0_choice == "7":
             print("Thank you for using Dod's Yoobee Student Database.")
             break
@@ -50,4 +52,10 @@ def main():
             print("Invalid choice, try again.")
             break
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    # Block-buffer stdout; input() flushes it before every prompt
+    with open(sys.stdout.fileno(), "w", buffering=65536, closefd=False) as out:
+        sys.stdout = out
+        try:
+            main()
+        finally:
+            sys.stdout = sys.__stdout__
\ No newline at end of file
@@ -8,26 +8,41 @@ Eduardo JR Ilagan
 """
 
 
-from YSDatabase import create_connection
+import sys
+from YSDatabase import get_conn,savepoint
 import sqlite3
 from YSclsrec_view import clsrec_view,clsrec_stuid_chk,clsrec_instid_chk,clsrec_sbjtid_chk
+from YSvalidations import ask_yn
 
 
 
+"""Function for the Add Records menu option"""
+def clsrec_add():
+    # Collect the entries first and save them all in one transaction
+    clsrec_rows = []
+    while True:
+        clsrec_stu_id = clsrec_stuid_chk() 
+        clsrec_sbjt_id = clsrec_sbjtid_chk()
+        clsrec_inst_id = clsrec_instid_chk()
+        clsrec_rows.append((clsrec_stu_id,clsrec_sbjt_id,clsrec_inst_id))
+        if not ask_yn("Add another class record?"):
+            break
+    add_clsrec_many(clsrec_rows)
+
+MENU_06_ACTIONS = {"1": clsrec_add, "2": clsrec_view}
+
+MENU_06_BANNER = ("\n==== Yoobee Class Record Menu ====\n"
+                  "1. Add Records\n"
+                  "2. View Record\n"
+                  "3. Go Back to Last Menu\n")
+
 def menu_06_clsrec():
     while True:
-        print("\n==== Yoobee Class Record Menu ====")
-        print("1. Add Records")
-        print("2. View Record")
-        print("3. Go Back to Last Menu")
+        sys.stdout.write(MENU_06_BANNER)
         m06_choice = input("Select an option (1-3): ")
-        if m06_choice == "1":
-            clsrec_stu_id = clsrec_stuid_chk() 
-            clsrec_sbjt_id = clsrec_sbjtid_chk()
-            clsrec_inst_id = clsrec_instid_chk()
-            add_clsrec(clsrec_stu_id,clsrec_sbjt_id,clsrec_inst_id)
-        elif m06_choice == "2":
-            clsrec_view()
+        action = MENU_06_ACTIONS.get(m06_choice)
+        if action:
+            action()
         elif m06_choice == "3":
             print("Going back to Main Menu.")
             break
@@ -39,35 +54,44 @@ def menu_06_clsrec():
 
 """Function for adding class records"""
 def add_clsrec(clsrec_stu_id,clsrec_sbjt_id,clsrec_inst_id):
-    conn = create_connection()
-    cursor = conn.cursor()
+    conn = get_conn()
     try:
-        cursor.execute("INSERT INTO class_records (stu_id,sbjt_id, inst_id ) VALUES (?,?,?)", (clsrec_stu_id,clsrec_sbjt_id,clsrec_inst_id))
-        conn.commit()
+        with savepoint(conn):
+            conn.execute("INSERT INTO class_records (stu_id,sbjt_id, inst_id ) VALUES (?,?,?)", (clsrec_stu_id,clsrec_sbjt_id,clsrec_inst_id))
         print(" Course added successfully.")
     except sqlite3.Error as e: 
         print(f"An error occurred during adding of the record: {e}")
-        conn.rollback() # Rollback if an error occurred
-    conn.close()
+
+"""Function for adding several class records in one transaction.
+Each row gets its own savepoint, so a row that fails is reported and skipped
+while the valid rows are kept."""
+def add_clsrec_many(rows):
+    conn = get_conn()
+    added = 0
+    for clsrec_stu_id,clsrec_sbjt_id,clsrec_inst_id in rows:
+        try:
+            with savepoint(conn):
+                conn.execute("INSERT INTO class_records (stu_id,sbjt_id, inst_id ) VALUES (?,?,?)", (clsrec_stu_id,clsrec_sbjt_id,clsrec_inst_id))
+            added += 1
+        except sqlite3.Error as e: 
+            print(f"An error occurred during adding of the record for student {clsrec_stu_id}, subject {clsrec_sbjt_id}, instructor {clsrec_inst_id}: {e}")
+    print(f" {added} of {len(rows)} class record(s) added successfully.")
 
 
 
 
 """Function for deleting course's records based on course ID """
 def delete_sbjt(sbjt_id):
-    conn = create_connection()
-    cursor = conn.cursor()
+    conn = get_conn()
     try:
-        cursor.execute("DELETE FROM subject WHERE sbjt_id = ?", (sbjt_id))
+        with savepoint(conn):
+            cursor = conn.execute("DELETE FROM subjects WHERE sbjt_id = ?", (sbjt_id,))
         ins_row_count = cursor.rowcount
         if ins_row_count > 0:
             print("Successfully deleted subject id ", sbjt_id,"from the record.")
         else:
             print(" There were no records deleted. Course ID ",sbjt_id," is no longer in the records.")
-        conn.commit()
     except sqlite3.Error as e: 
         print(f"An error occurred during deletion: {e}")
-        conn.rollback() # Rollback if an error occurred
-    conn.close()
 
 
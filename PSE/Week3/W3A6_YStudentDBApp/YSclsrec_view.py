@@ -7,257 +7,164 @@ YSclsrec_view.py - Week 3 Activity 6 - W3A6 - EJI
 Eduardo JR Ilagan
 """
 
+import sys
 import sqlite3
-from YSDatabase import create_connection
+from YSDatabase import get_conn
+from YSdisplay import print_header,print_rows,print_cursor
 from YSinst_manager import view_inst
 from YSstu_manager import view_student
 from YSsbjt_manager import view_sbjt
 from YScrse_manager import view_crse
+from YSvalidations import ask_yn
 
-
-def clsrec_view():
-    while True:
-        print("\n====== Yoobee Class Record View Menu ======")
-        print("For which information are you looking for?")
-        print("1. View by Student")
-        print("2. View by Instructor")
-        print("3. View by Subject")
-        print("4. Go Back to Last Menu")
-        m060_choice = input("Select an option (1-4): ")
-        if m060_choice == "1":
-            clsrec_stuid = clsrec_stuid_chk()
-            search=clsrec_v_stuid(clsrec_stuid)
-        elif m060_choice == "2":
-            clsrec_instid = clsrec_instid_chk() 
-            search=clsrec_v_instid(clsrec_instid)
-        elif m060_choice == "3":
-            clsrec_sbjtid = clsrec_sbjtid_chk()
-            search=clsrec_v_sbjtid(clsrec_sbjtid)
-        elif m060_choice == "5":
-            print("Going back to Previuos Menu.")
-            break
-        else:
-            print("Invalid Input. Going back to Previous Menu.")
-            break
-        for search in search:
-            print(search)
-
-"""Function for getting the relevant course id for the subject records"""
-def clsrec_crseid_chk():
-    instid_check = input("Do you know the Course's ID this record is for? (Y/N)").upper()
-    if instid_check == "Y":
-        inst_id = input("Please enter Course's ID: ")
-    else:
-        inst_name = input("Get the details of the course by searching using the course's name: " )
-        search=view_crse(inst_name)
-        for search in search:
-            print(search)
-        inst_id = input("Enter Course's ID: ")
-    return inst_id
-
-"""Function for viewing class records based on Course ID """
-def clsrec_v_crseid(clsrec_crseid):
-    conn = create_connection()
-    cursor = conn.cursor()
-    search_pattern = f"{clsrec_crseid}"
-    search_query = f"""SELECT c.crse_id Course_ID
+"""Class record queries kept as constants so the connection's statement cache reuses them"""
+SQL_CLSREC_BY_CRSE = """SELECT c.crse_id Course_ID,
                                 c.crse_name Course,
                                 c.crse_timeframe Course_Intake,
                                 s.sbjt_name Subject,
                                 i.inst_name Instructor,
                                 s.sbjt_sched Schedule,
                                 st.stu_name Student
-                           FROM subjects s, 
-                                courses c,
-                                instructors i,
-                                class_records cl,
-                                students st
-                          WHERE cl.sbjt_id = s.sbjt_id
-                            AND cl.inst_id = i.inst_id
-                            AND cl.stu_id = st.stu_id
-                            AND s.crse_id = c.crse_id 
-                            AND s.inst_id = i.inst_id 
-                            AND c.crse_id = ?
+                           FROM class_records cl
+                           JOIN students st ON st.stu_id = cl.stu_id
+                           JOIN subjects s ON s.sbjt_id = cl.sbjt_id
+                           JOIN instructors i ON i.inst_id = cl.inst_id
+                                             AND i.inst_id = s.inst_id
+                           JOIN courses c ON c.crse_id = s.crse_id
+                          WHERE c.crse_id = ?
                     """
-    cursor.execute(search_query,(search_pattern,))
-    # Get Column Names (Aliases) from cursor.description
-    rows = cursor.fetchall()
-    if rows :
-        print("Record found from record.")
-    else:
-        print(f"No record for Instructor ID'{clsrec_crseid}' exists.")
-    if cursor.description:
-        column_aliases = [description[0] for description in cursor.description]
-    else:
-        print("No cursor description available.")
-    # Fetch and print data using aliases as headers
-    print(column_aliases)
-    conn.close()
-    return rows
 
-"""Function for viewing class records based on course Student ID """
-def clsrec_v_stuid(clsrec_stuid):
-    conn = create_connection()
-    cursor = conn.cursor()
-    search_pattern = f"{clsrec_stuid}"
-    search_query = f"""SELECT st.stu_id Student_ID,
+SQL_CLSREC_BY_STU = """SELECT st.stu_id Student_ID,
                                 st.stu_name Student,
                                 cl.marking Markings,
                                 s.sbjt_name Subject,
                                 s.sbjt_sched Schedule,
                                 c.crse_name Course,
                                 i.inst_name Instructor
-                           FROM subjects s, 
-                                courses c,
-                                instructors i,
-                                class_records cl,
-                                students st
-                          WHERE cl.sbjt_id = s.sbjt_id
-                            AND cl.inst_id = i.inst_id
-                            AND cl.stu_id = st.stu_id
-                            AND s.crse_id = c.crse_id 
-                            AND s.inst_id = i.inst_id 
-                            AND cl.stu_id = ?
+                           FROM class_records cl
+                           JOIN students st ON st.stu_id = cl.stu_id
+                           JOIN subjects s ON s.sbjt_id = cl.sbjt_id
+                           JOIN instructors i ON i.inst_id = cl.inst_id
+                                             AND i.inst_id = s.inst_id
+                           JOIN courses c ON c.crse_id = s.crse_id
+                          WHERE cl.stu_id = ?
                     """
-    cursor.execute(search_query,(search_pattern,))
-    # Get Column Names (Aliases) from cursor.description
-    rows = cursor.fetchall()
-    if rows :
-        print("Record found in system.")
-    else:
-        print(f"No record for Student ID'{clsrec_stuid}' exists.")
-    if cursor.description:
-        column_aliases = [description[0] for description in cursor.description]
-    else:
-        print("No cursor description available.")
-    # Fetch and print data using aliases as headers
-    print(column_aliases)
-    conn.close()
-    return rows
 
-"""Function for viewing class records based on course Instructors ID """
-def clsrec_v_instid(clsrec_instid):
-    conn = create_connection()
-    cursor = conn.cursor()
-    search_pattern = f"{clsrec_instid}"
-    search_query = f"""SELECT i.inst_id Instructor_ID,
+SQL_CLSREC_BY_INST = """SELECT i.inst_id Instructor_ID,
                                 i.inst_name Instructor,
                                 s.sbjt_name Subject,
                                 s.sbjt_sched Schedule,
                                 c.crse_name Course,
                                 st.stu_name Student
-                           FROM subjects s, 
-                                courses c,
-                                instructors i,
-                                class_records cl,
-                                students st
-                          WHERE cl.sbjt_id = s.sbjt_id
-                            AND cl.inst_id = i.inst_id
-                            AND cl.stu_id = st.stu_id
-                            AND s.crse_id = c.crse_id 
-                            AND s.inst_id = i.inst_id 
-                            AND cl.inst_id = ?
+                           FROM class_records cl
+                           JOIN students st ON st.stu_id = cl.stu_id
+                           JOIN subjects s ON s.sbjt_id = cl.sbjt_id
+                           JOIN instructors i ON i.inst_id = cl.inst_id
+                                             AND i.inst_id = s.inst_id
+                           JOIN courses c ON c.crse_id = s.crse_id
+                          WHERE cl.inst_id = ?
                     """
-    cursor.execute(search_query,(search_pattern,))
-    # Get Column Names (Aliases) from cursor.description
-    rows = cursor.fetchall()
-    if rows :
-        print("Record found from record.")
-    else:
-        print(f"No record for Instructor ID'{clsrec_instid}' exists.")
-    if cursor.description:
-        column_aliases = [description[0] for description in cursor.description]
-    else:
-        print("No cursor description available.")
-    # Fetch and print data using aliases as headers
-    print(column_aliases)
-    conn.close()
-    return rows
 
-"""Function for viewing class records based on Subject ID """
-def clsrec_v_sbjtid(clsrec_sbjtid):
-    conn = create_connection()
-    cursor = conn.cursor()
-    search_pattern = f"{clsrec_sbjtid}"
-    search_query = f"""SELECT s.sbjt_id Subject_ID,
+SQL_CLSREC_BY_SBJT = """SELECT s.sbjt_id Subject_ID,
                                 s.sbjt_name Subject,
                                 i.inst_name Instructor,
                                 s.sbjt_sched Schedule,
                                 c.crse_name Course,
                                 st.stu_name Student
-                           FROM subjects s, 
-                                courses c,
-                                instructors i,
-                                class_records cl,
-                                students st
-                          WHERE cl.sbjt_id = s.sbjt_id
-                            AND cl.inst_id = i.inst_id
-                            AND cl.stu_id = st.stu_id
-                            AND s.crse_id = c.crse_id 
-                            AND s.inst_id = i.inst_id 
-                            AND cl.sbjt_id = ?
+                           FROM class_records cl
+                           JOIN students st ON st.stu_id = cl.stu_id
+                           JOIN subjects s ON s.sbjt_id = cl.sbjt_id
+                           JOIN instructors i ON i.inst_id = cl.inst_id
+                                             AND i.inst_id = s.inst_id
+                           JOIN courses c ON c.crse_id = s.crse_id
+                          WHERE cl.sbjt_id = ?
                     """
-    cursor.execute(search_query,(search_pattern,))
-    # Get Column Names (Aliases) from cursor.description
-    rows = cursor.fetchall()
-    if rows :
+
+
+MENU_060_BANNER = ("\n====== Yoobee Class Record View Menu ======\n"
+                   "For which information are you looking for?\n"
+                   "1. View by Student\n"
+                   "2. View by Instructor\n"
+                   "3. View by Subject\n"
+                   "4. Go Back to Last Menu\n")
+
+def clsrec_view():
+    while True:
+        sys.stdout.write(MENU_060_BANNER)
+        m060_choice = input("Select an option (1-4): ")
+        views = CLSREC_VIEWS.get(m060_choice)
+        if views:
+            id_chk, view_fn = views
+            view_fn(id_chk())
+        elif m060_choice == "4":
+            print("Going back to Previuos Menu.")
+            break
+        else:
+            print("Invalid Input. Going back to Previous Menu.")
+            break
+
+"""Function for running a class record query and printing its rows as they are fetched.
+Returns the number of rows shown."""
+def stream_clsrec(search_query, clsrec_id, label):
+    cursor = get_conn().execute(search_query,(clsrec_id,))
+    first_row = cursor.fetchone()
+    if first_row is not None:
         print("Record found from record.")
     else:
-        print(f"No record for Instructor ID'{clsrec_sbjtid}' exists.")
-    if cursor.description:
-        column_aliases = [description[0] for description in cursor.description]
+        print(f"No record for {label} ID '{clsrec_id}' exists.")
+    print_header(cursor, search_query)
+    if first_row is None:
+        return 0
+    return print_cursor(cursor, first_row)
+
+"""Function for getting the relevant course id for the subject records"""
+def clsrec_crseid_chk():
+    return prompt_for_id("Course", view_crse)
+
+"""Function for viewing class records based on Course ID """
+def clsrec_v_crseid(clsrec_crseid):
+    return stream_clsrec(SQL_CLSREC_BY_CRSE, clsrec_crseid, "Course")
+
+"""Function for viewing class records based on course Student ID """
+def clsrec_v_stuid(clsrec_stuid):
+    return stream_clsrec(SQL_CLSREC_BY_STU, clsrec_stuid, "Student")
+
+"""Function for viewing class records based on course Instructors ID """
+def clsrec_v_instid(clsrec_instid):
+    return stream_clsrec(SQL_CLSREC_BY_INST, clsrec_instid, "Instructor")
+
+"""Function for viewing class records based on Subject ID """
+def clsrec_v_sbjtid(clsrec_sbjtid):
+    return stream_clsrec(SQL_CLSREC_BY_SBJT, clsrec_sbjtid, "Subject")
+
+"""Function for asking for the ID of a record, searching by name first if the user does not know it"""
+def prompt_for_id(label, view_fn):
+    if ask_yn(f"Do you know the {label}'s ID this record is for?"):
+        return input(f"Please enter {label}'s ID: ")
+    name = input(f"Get the details of the {label.lower()} by searching by the {label.lower()}'s name: ")
+    rows = list(view_fn(name))
+    if rows:
+        print_rows(rows)
+        print(f"Please take note of {label}'s ID")
     else:
-        print("No cursor description available.")
-    # Fetch and print data using aliases as headers
-    print(column_aliases)
-    conn.close()
-    return rows
+        print(f"There are no records for {label}'s name: '{name}' ")
+    return input(f"Enter {label}'s ID: ")
 
 """Function for getting the relevant student id for the class record"""
 def clsrec_stuid_chk():
-    clsrec_info_chk = input("Do you know the Student ID this record is for? (Y/N): ").upper()
-    if clsrec_info_chk == "Y":
-        clsrec_stu_id = input("Please enter Student's ID: ")
-    else:
-        stu_name = input("Get the details of the student by searching by the student's name: ")
-        search=view_student(stu_name)
-        for search in search:
-            print(search)
-        if search == "":
-            print("There are no records for Student's name: '{stu_name}' ")
-        else:
-            print("Please take note of Student's ID")
-            clsrec_stu_id = input("Enter student's ID: ")            
-    return clsrec_stu_id
-
-
+    return prompt_for_id("Student", view_student)
 
 """Function for getting the relevant instructor id for the subject record"""
 def clsrec_instid_chk():
-    instid_check = input("Do you know the Instructor's ID this record is for? (Y/N)").upper()
-    if instid_check == "Y":
-        inst_id = input("Please enter Instructor's ID: ")
-    else:
-        inst_name = input("Get the details of the instructor by searching by the instructor's name: " )
-        search=view_inst(inst_name)
-        for search in search:
-            print(search)
-        inst_id = input("Enter Instructor's ID: ")
-    return inst_id
+    return prompt_for_id("Instructor", view_inst)
 
-"Function for getting the relevant subject id for the class record"""
+"""Function for getting the relevant subject id for the class record"""
 def clsrec_sbjtid_chk():
-    clsrec_info_check = input("Do you know the details of the subject this record is for? (Y/N): ").upper()
-    if clsrec_info_check == "Y":
-        clsrec_sbjt_id = input("Please enter the subject ID:")
-    else:
-        clsrec_sbjtid_check = input("Do you know the subject's ID? (Y/N)").upper()
-        if clsrec_sbjtid_check == "Y":
-            clsrec_sbjt_id = input("Please enter subject's ID: ")
-        else:
-            sbjt_name = input("Get the details of the subject by searching by the subject's name: " )
-            search=view_sbjt(sbjt_name)
-            for search in search:
-                print(search)
-            clsrec_sbjt_id = input("Please enter Subject's ID: ")
-    return clsrec_sbjt_id
\ No newline at end of file
+    return prompt_for_id("Subject", view_sbjt)
+
+"""Menu option -> (function asking for the id, function viewing the records for it)"""
+CLSREC_VIEWS = {
+    "1": (clsrec_stuid_chk, clsrec_v_stuid),
+    "2": (clsrec_instid_chk, clsrec_v_instid),
+    "3": (clsrec_sbjtid_chk, clsrec_v_sbjtid),
+}
\ No newline at end of file
@@ -7,48 +7,61 @@ YSCourse.py - Week 3 Activity 6 - W3A6 - EJI
 Eduardo JR Ilagan
 """
 
-from YSDatabase import create_connection
+import sys
+from YSDatabase import get_conn,savepoint
+from YSdisplay import print_rows
+from YSvalidations import ask_yn
 import sqlite3
 
+SQL_VIEW_CRSE = "SELECT crse_id, crse_name, crse_timeframe FROM courses WHERE crse_name LIKE ?"
+
+"""Function for the Add Course menu option"""
+def crse_add():
+    crse_name = input("Course Name: ")
+    crse_tframe = input("Pleae enter the year (YYYY) and intake month (MM) (e.g. 202304 for 2023 April): ")
+    add_crse(crse_name,crse_tframe)
+
+"""Function for the View Course menu option"""
+def crse_view():
+    crse_name = input("Enter Course Name: ")
+    rows=view_crse(crse_name)
+    print_rows(rows)
+
+"""Function for the Delete Course menu option"""
+def crse_del():
+    if ask_yn("Do you know the details of the record you wish to delete?"):
+        if ask_yn("Do you know the Course's ID?"):
+            crse_id = input("Enter Course's ID: ")
+            delete_crse(crse_id)
+        else:
+            crse_name = input("Enter Name: ")
+            rows=view_crse(crse_name)
+            print_rows(rows)
+            crse_id = input("Enter Course's ID: ")
+            delete_crse(crse_id)
+    else:
+        crse_name=input("Get the details of the course by searching by the course's name:" )
+        rows=view_crse(crse_name)
+        print_rows(rows)
+        print("Please take note of Course's ID")
+        crse_id = input("Enter course's ID: ")
+        delete_crse(crse_id)
+
+MENU_03_ACTIONS = {"1": crse_add, "2": crse_view, "3": crse_del}
+
+MENU_03_BANNER = ("\n==== Yoobee Course Menu ====\n"
+                  "1. Add Course\n"
+                  "2. View Course\n"
+                  "3. Delete Course Record\n"
+                  "4. Go Back to Last Menu\n")
+
 def menu_03_crse():
     while True:
-        print("\n==== Yoobee Course Menu ====")
-        print("1. Add Course")
-        print("2. View Course")
-        print("3. Delete Course Record")
-        print("4. Go Back to Last Menu")
+        sys.stdout.write(MENU_03_BANNER)
         m03_choice = input("Select an option (1-4): ")
-        if m03_choice == "1":
-            crse_name = input("Course Name: ")
-            crse_tframe = input("Pleae enter the year (YYYY) and intake month (MM) (e.g. 202304 for 2023 April): ")
-            add_crse(crse_name,crse_tframe)
-        elif m03_choice == "2":
-            crse_name = input("Enter Course Name: ")
-            search=view_crse(crse_name)
-            for search in search:
-                print(search)
-        elif m03_choice == "3":
-            rec_info_check = input("Do you know the details of the record you wish to delete? (Y/N): ").upper()
-            if rec_info_check == "Y":
-                crsid_check = input("Do you know the Course's ID? (Y/N)").upper()
-                if crsid_check == "Y":
-                    crse_id = input("Enter Course's ID: ")
-                    delete_crse(crse_id)
-                else:
-                    crse_name = input("Enter Name: ")
-                    search=view_crse(crse_name)
-                    for search in search:
-                        print(search)
-                    crse_id = input("Enter Course's ID: ")
-                    delete_crse(crse_id)
-            else:
-                crse_name=input("Get the details of the course by searching by the course's name:" )
-                search=view_crse(crse_name)
-                for search in search:
-                    print(search)
-                print("Please take note of Course's ID")
-                crse_id = input("Enter course's ID: ")
-                delete_crse(crse_id)
+        action = MENU_03_ACTIONS.get(m03_choice)
+        if action:
+            action()
         elif m03_choice == "4":
             print("Going back to Main Menu.")
             break
@@ -58,49 +71,48 @@ def menu_03_crse():
 
 """Function for adding Course records"""
 def add_crse(crse_name,crse_tframe):
-    conn = create_connection()
-    cursor = conn.cursor()
+    conn = get_conn()
     try:
-        cursor.execute("INSERT INTO courses (crse_name, crse_timeframe) VALUES (?,?)", (crse_name, crse_tframe ))
-        conn.commit()
+        with savepoint(conn):
+            conn.execute("INSERT INTO courses (crse_name, crse_timeframe) VALUES (?,?)", (crse_name, crse_tframe ))
         print(" Course added successfully.")
     except sqlite3.Error as e: 
         print(f"An error occurred during adding of the record: {e}")
-        conn.rollback() # Rollback if an error occurred
-    conn.close()
+
+"""Function for adding several Course records in a single transaction"""
+def add_crse_many(rows):
+    conn = get_conn()
+    try:
+        with savepoint(conn):
+            conn.executemany("INSERT INTO courses (crse_name, crse_timeframe) VALUES (?,?)", rows)
+        print(f" {len(rows)} course(s) added successfully.")
+    except sqlite3.Error as e: 
+        print(f"An error occurred during adding of the records: {e}")
 
     """Function for viewing course records based on course Name wild card search"""
 def view_crse(crse_name):
-    conn = create_connection()
+    conn = get_conn()
     cursor = conn.cursor()
-    cursor.execute("SELECT * FROM courses WHERE crse_name LIKE ?", ('%' + crse_name + '%',))
+    # rows carry their column names so print_rows can line the header up with the data
+    cursor.row_factory = sqlite3.Row
+    cursor.execute(SQL_VIEW_CRSE, ('%' + crse_name + '%',))
     rows = cursor.fetchall()
     if rows :
         print("Record found from course table.")
     else:
         print(f"No record for '{crse_name}' exists.")
-    if cursor.description:
-        column_aliases = [description[0] for description in cursor.description]
-    else:
-        print("No cursor description available.")
-    # Fetch and print data using aliases as headers
-    print(column_aliases)
-    conn.close()
     return rows
 
 """Function for deleting course's records based on course ID """
 def delete_crse(crse_id):
-    conn = create_connection()
-    cursor = conn.cursor()
+    conn = get_conn()
     try:
-        cursor.execute("DELETE FROM courses WHERE crse_id = ?", (crse_id))
+        with savepoint(conn):
+            cursor = conn.execute("DELETE FROM courses WHERE crse_id = ?", (crse_id,))
         ins_row_count = cursor.rowcount
         if ins_row_count > 0:
             print("Successfully deleted course id ", crse_id,"from the record.")
         else:
             print(" There were no records deleted. Course ID ",crse_id," is not in the records.")
-        conn.commit()
     except sqlite3.Error as e: 
-        print(f"An error occurred during deletion: {e}")
-        conn.rollback() # Rollback if an error occurred
-    conn.close()
\ No newline at end of file
+        print(f"An error occurred during deletion: {e}")
\ No newline at end of file
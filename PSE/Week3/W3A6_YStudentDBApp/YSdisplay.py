@@ -0,0 +1,57 @@
+"""Week 3 - Activity 6: Develop the python code for Week 3 - Activity 4
+Use the sample code to develop a command-line application for Week 3 - Activity 4, incorporating a database sqlite3 
+and have at least three functionality such as add records, delete records and view records for different tables.
+Share the completed project on GitHub here, with including a README.txt file in your repository to describe the technical aspects of this project (Yoobee Colleges).
+
+YSdisplay.py - Week 3 Activity 6 - W3A6 - EJI
+Eduardo JR Ilagan
+"""
+import sys
+
+"""Display functions for query results"""
+# formats one row; with widths every column is padded to the width of the widest value in that column
+def format_row(row, widths=None):
+    if widths is None:
+        return " | ".join(str(value) for value in row)
+    return " | ".join(str(value).ljust(width) for value, width in zip(row, widths)).rstrip()
+
+# header lines keyed by the SQL text that produced them; a query's columns never change
+HEADER_CACHE = {}
+
+# prints the column names (aliases) of the executed query, building the header line only once per SQL string
+def print_header(cursor, sql):
+    header = HEADER_CACHE.get(sql)
+    if header is None:
+        header = HEADER_CACHE[sql] = " | ".join(description[0] for description in cursor.description) + "\n"
+    sys.stdout.write(header)
+
+# column names of a row fetched with the sqlite3.Row row factory (the search views use it), None for plain tuples
+def row_names(row):
+    return tuple(row.keys()) if hasattr(row, "keys") else None
+
+# prints all the rows with a single write instead of one print per row;
+# rows that carry their column names get a header padded to the same widths as the data
+def print_rows(rows):
+    if not rows:
+        return
+    names = row_names(rows[0])
+    table = [names, *rows] if names else rows
+    widths = [max(len(str(value)) for value in column) for column in zip(*table)]
+    sys.stdout.write("\n".join(format_row(row, widths) for row in table) + "\n")
+
+
+# prints the rows of a cursor (or a row generator such as view_student) as they are fetched without building a list of them first
+def print_cursor(cursor, first_row=None):
+    count = 0
+    if first_row is not None:
+        sys.stdout.write(format_row(first_row) + "\n")
+        count = 1
+    for row in cursor:
+        if count == 0:
+            # rows streamed from a search view carry their names; write them before the first row
+            names = row_names(row)
+            if names:
+                sys.stdout.write(format_row(names) + "\n")
+        sys.stdout.write(format_row(row) + "\n")
+        count += 1
+    return count
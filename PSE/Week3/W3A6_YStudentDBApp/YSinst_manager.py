@@ -7,49 +7,61 @@ YSinst_manager.py - Week 3 Activity 6 - W3A6 - EJI
 Eduardo JR Ilagan
 """
 
-from YSDatabase import create_connection
+import sys
+from YSDatabase import get_conn,savepoint
+from YSdisplay import print_rows
+from YSvalidations import ask_yn
 import sqlite3
 
+SQL_VIEW_INST = "SELECT inst_id, inst_name FROM instructors WHERE inst_name LIKE ?"
+
+"""Function for the Add Instructor menu option"""
+def inst_add():
+    inst_name = input("Name: ")
+    add_inst(inst_name)
+
+"""Function for the View Instructor menu option"""
+def inst_view():
+    inst_name = input("Enter Name: ")
+    rows=view_inst(inst_name)
+    print_rows(rows)
+
+"""Function for the Delete Instructor menu option"""
+def inst_del():
+    if ask_yn("Do you know the details of the record you wish to delete?"):
+        if ask_yn("Do you know the Instructor's ID?"):
+            inst_id = input("Enter Instructor's ID: ")
+            delete_inst(inst_id)
+        else:
+            inst_name = input("Get the details of the instructor by searching by the instructor's name:" )
+            rows=view_inst(inst_name)
+            print_rows(rows)
+            inst_id = input("Enter Instructor's ID: ")
+            delete_inst(inst_id)
+    else:
+        inst_name=input("Get the details of the instructor by searching by the instructor's name:" )
+        rows=view_inst(inst_name)
+        print_rows(rows)
+        print("Please take note of Instructor's ID")
+        inst_id = input("Enter instructor's ID: ")
+        delete_inst(inst_id)
+
+MENU_02_ACTIONS = {"1": inst_add, "2": inst_view, "3": inst_del}
+
+MENU_02_BANNER = ("\n==== Yoobee Instructor Menu ====\n"
+                  "1. Add Instructor\n"
+                  "2. View Insturctor\n"
+                  "3. Delete Instructor Record\n"
+                  "4. Go Back to Last Menu\n")
+
 """Function for Instructor Menu"""
 def menu_02_inst():
     while True:
-        print("\n==== Yoobee Instructor Menu ====")
-        print("1. Add Instructor")
-        print("2. View Insturctor")
-        print("3. Delete Instructor Record")
-        print("4. Go Back to Last Menu")
-        #print("4. Blank")
+        sys.stdout.write(MENU_02_BANNER)
         m02_choice = input("Select an option (1-4): ")
-        if m02_choice == "1":
-            inst_name = input("Name: ")
-            add_inst(inst_name)
-        elif m02_choice == "2":
-            inst_name = input("Enter Name: ")
-            search=view_inst(inst_name)
-            for search in search:
-                print(search)
-        elif m02_choice == "3":
-            rec_info_check = input("Do you know the details of the record you wish to delete? (Y/N): ").upper()
-            if rec_info_check == "Y":
-                instid_check = input("Do you know the Instructor's ID? (Y/N)").upper()
-                if instid_check == "Y":
-                    inst_id = input("Enter Instructor's ID: ")
-                    delete_inst(inst_id)
-                else:
-                    inst_name = input("Get the details of the instructor by searching by the instructor's name:" )
-                    search=view_inst(inst_name)
-                    for search in search:
-                        print(search)
-                    inst_id = input("Enter Instructor's ID: ")
-                    delete_inst(inst_id)
-            else:
-                inst_name=input("Get the details of the instructor by searching by the instructor's name:" )
-                search=view_inst(inst_name)
-                for search in search:
-                    print(search)
-                print("Please take note of Instructor's ID")
-                inst_id = input("Enter instructor's ID: ")
-                delete_inst(inst_id)
+        action = MENU_02_ACTIONS.get(m02_choice)
+        if action:
+            action()
         elif m02_choice == "4":
             print("Going back to Main Menu.")
             break
@@ -60,77 +72,75 @@ def menu_02_inst():
 
 """Function for adding Instructor records"""
 def add_inst(inst_name):
-    conn = create_connection()
-    cursor = conn.cursor()
+    conn = get_conn()
     try:
-        cursor.execute("INSERT INTO instructors (inst_name) VALUES (?)", (inst_name,))
-        conn.commit()
+        with savepoint(conn):
+            conn.execute("INSERT INTO instructors (inst_name) VALUES (?)", (inst_name,))
         print(" Instructor added successfully.")
     except sqlite3.Error as e: 
         print(f"An error occurred during adding of the record: {e}")
-        conn.rollback() # Rollback if an error occurred
-    conn.close()
+
+"""Function for adding several Instructor records in a single transaction"""
+def add_inst_many(rows):
+    conn = get_conn()
+    try:
+        with savepoint(conn):
+            conn.executemany("INSERT INTO instructors (inst_name) VALUES (?)", rows)
+        print(f" {len(rows)} instructor(s) added successfully.")
+    except sqlite3.Error as e: 
+        print(f"An error occurred during adding of the records: {e}")
 
 """Function for viewing instructor records based on Student Name wild card search"""
 def view_inst(inst_name):
-    conn = create_connection()
+    conn = get_conn()
     cursor = conn.cursor()
-    cursor.execute("SELECT * FROM instructors WHERE inst_name LIKE ?", ('%' + inst_name + '%',))
+    # rows carry their column names so print_rows can line the header up with the data
+    cursor.row_factory = sqlite3.Row
+    cursor.execute(SQL_VIEW_INST, ('%' + inst_name + '%',))
     rows = cursor.fetchall()
     if rows :
         print("Record found from instructor table.")
     else:
         print(f"No record for '{inst_name}' exists.")
-    if cursor.description:
-        column_aliases = [description[0] for description in cursor.description]
-    else:
-        print("No cursor description available.")
-    # Fetch and print data using aliases as headers
-    print(column_aliases)
-    conn.close()
     return rows
 
-"""Function for viewing instructor inst_name based on Instructor Id search"""
+"""Function for viewing instructor inst_name based on Instructor Id search. Returns None when the id does not exist"""
 def view_instname_vid(inst_id):
-    conn = create_connection()
+    conn = get_conn()
     cursor = conn.cursor()
-    cursor.execute(f"SELECT inst_name FROM instructors WHERE inst_id = {inst_id} ")
+    cursor.execute("SELECT inst_name FROM instructors WHERE inst_id = ?", (inst_id,))
     rows = cursor.fetchall()
     if rows :
         inst_name = rows[0]
         print(f"Record found for instructor {inst_name[0]} in the instructor records.")
     else:
         print(f"No record for instructor id'{inst_id}' exists.")
-    conn.close()
+        return None
     return rows[0]
 
 """Function for deleting instructor's records based on instructor ID """
 def delete_inst(inst_id):
-    conn = create_connection()
-    cursor = conn.cursor()
+    conn = get_conn()
     try:
-        cursor.execute("DELETE FROM instructors WHERE inst_id = ?", (inst_id))
+        with savepoint(conn):
+            cursor = conn.execute("DELETE FROM instructors WHERE inst_id = ?", (inst_id,))
         ins_row_count = cursor.rowcount
         if ins_row_count > 0:
             print("Successfully deleted instructor id ", inst_id,"from the record.")
         else:
             print(" There were no records deleted. Instructor ID ",inst_id," is not nger in the records.")
-        conn.commit()
     except sqlite3.Error as e: 
         print(f"An error occurred during deletion: {e}")
-        conn.rollback() # Rollback if an error occurred
-    conn.close()
 
 def view_sturec_vid(stu_id):
-    conn = create_connection()
+    conn = get_conn()
     cursor = conn.cursor()
-    cursor.execute(f"SELECT * FROM students WHERE stu_id = {stu_id} ")
+    cursor.execute("SELECT * FROM students WHERE stu_id = ?", (int(stu_id),))
     rows = cursor.fetchall()
     if rows :
         stu_name = rows[0]
         print(f"Record found for student {stu_name[0]} in the students records.")
     else:
         print(f"No record for student id'{stu_id}' exists.")
-    conn.close()
     return rows
 
@@ -7,105 +7,115 @@ YSpay_manager.py - Week 3 Activity 6 - W3A6 - EJI
 Eduardo JR Ilagan
 """
 
-from YSDatabase import create_connection
-from YSstu_manager import view_student,check_stu_pay,view_sturec_vid
-from YSvalidations import chk_int,date_valid
+import sys
+from YSDatabase import get_conn,savepoint
+from YSdisplay import print_rows,print_cursor
+from YSstu_manager import view_student,check_stu_pay
+from YSvalidations import ask_yn,chk_int,date_valid,date_ordinal
 import sqlite3
 
+"""Payment queries kept as constants so the connection's statement cache reuses them"""
+SQL_ADD_PAY = "INSERT INTO payments (stu_id, amount, pd_date, pd_date_int) VALUES (?, ?, ?, ?)"
+SQL_DEL_PAY = "DELETE FROM payments WHERE stu_id = ? AND pd_date_int = ?"
+
+"""Function for the Add Payment menu option"""
+def pay_add_opt():
+    if not ask_yn("Do you know the student's ID?"):
+        stu_name = input("Enter Name: ")
+        rows=view_student(stu_name)
+        print_cursor(rows)
+        print("Please take note of Student's ID")
+    pay_add()
+
+"""Function for the Delete Payment menu option"""
+def pay_del_opt():
+    if ask_yn("Do you know the details of the record you wish to delete?"):
+        if not ask_yn("Do you know the student's ID?"):
+            stu_name = input("Enter Name: ")
+            rows=view_student(stu_name)
+            print_cursor(rows)
+            print("Please take note of Student's ID")
+        pay_del()
+    else:
+        stu_name=input("Get the details of the student by searching by the student's name:" )
+        # keep the listed rows by id so the chosen student's name is known without another SELECT
+        rows_by_id = {row[0]: row for row in view_student(stu_name)}
+        print_rows(list(rows_by_id.values()))
+        print("Please take note of Student's ID")
+        stu_id = chk_int(input("Enter student's ID: "))
+        paydet=check_stu_pay(stu_id)
+        if paydet:
+            record=paydet[0]
+            print("Here are the details: ",record )
+            # the id and name are already known here, so pay_del only asks for the date
+            pay_del(stu_id, record[1])
+        else:
+            chosen = rows_by_id.get(stu_id)
+            if chosen:
+                print(f"There are no payment records for {chosen[1]} to delete.")
+            else:
+                print(f"There is no student with ID {stu_id} in the records listed.")
+
+MENU_05_ACTIONS = {"1": pay_add_opt, "2": pay_del_opt}
+
+MENU_05_BANNER = ("\n==== Yoobee Payments Menu ====\n"
+                  "1. Add Student Payment Record\n"
+                  "2. Delete Student Payment Record\n"
+                  "3. Go Back to Last Menu\n")
+
 """Function for the Payemnts Menu"""
 def menu_05_pay():
     while True:
-        print("\n==== Yoobee Payments Menu ====")
-        print("1. Add Student Payment Record")
-        print("2. Delete Student Payment Record")
-        print("3. Go Back to Last Menu")
-        m02_choice = input("Select an option (1-3):")
-        if m02_choice == "1":
-                pay_check = input("Do you know the student's ID? (Y/N)").upper()
-                if pay_check == "Y":
-                    pay_add()
-                else:
-                    stu_name = input("Enter Name: ")
-                    search=view_student(stu_name)
-                    for search in search:
-                        print(search)
-                    print("Please take note of Student's ID")
-                    pay_add()
-        elif m02_choice == "2":
-            rec_info_check = input("Do you know the details of the record you wish to delete? (Y/N): ").upper()
-            if rec_info_check == "Y":
-                pay_check = input("Do you know the student's ID? (Y/N)").upper()
-                if pay_check == "Y":
-                    pay_del()
-                else:
-                    stu_name = input("Enter Name: ")
-                    search=view_student(stu_name)
-                    for search in search:
-                        print(search)
-                        print("Please take note of Student's ID")
-                        pay_del()
-            else:
-                stu_name=input("Get the details of the student by searching by the student's name:" )
-                search=view_student(stu_name)
-                for search in search:
-                    print(search)
-                print("Please take note of Student's ID")
-                stu_id = input("Enter student's ID: ")
-                paydet=check_stu_pay(stu_id)
-                if paydet:
-                    record=paydet[0]
-                    print("Here are the details: ",record )
-                    pay_del()
-                else:
-                    stu_name=view_sturec_vid(stu_id)
-                    print(f"There are no payment records for {stu_name[0]} to delete.")
-        elif m02_choice == "3":
+        sys.stdout.write(MENU_05_BANNER)
+        m05_choice = input("Select an option (1-3):")
+        action = MENU_05_ACTIONS.get(m05_choice)
+        if action:
+            action()
+        elif m05_choice == "3":
             print("Going back to Main Menu.")
             break
         else:
             print("Invalid Input. Going back to Main Menu.")
             break
-            
+
 """Function for adding payment records to the payments table"""
 def add_pay_record(stu_id, amount, pd_date):
-    conn = create_connection()
-    cursor = conn.cursor()
+    add_pay_many([(stu_id, amount, pd_date)])
+
+"""Function for adding several payment records in a single transaction"""
+def add_pay_many(rows):
+    conn = get_conn()
     # try catch exception errors for SQL execution
     try:
-        cursor.execute("INSERT INTO payments (stu_id, amount, pd_date ) VALUES (?, ?, ?)", (stu_id, amount, pd_date))
+        with savepoint(conn):
+            cursor = conn.executemany(SQL_ADD_PAY, ((stu_id, amount, pd_date, date_ordinal(pd_date)) for stu_id, amount, pd_date in rows))
         ins_row_count = cursor.rowcount
         if ins_row_count > 0:
             print(" Payment recorded successfully.")
         else:
             print(" There were no records added.")
-        conn.commit()
     # try catch exception errors for SQL execution
     except sqlite3.Error as e:
-         print(f"An error occurred during deletion: {e}")
-         conn.rollback() # Rollback if an error occurred
-    conn.close()
+         print(f"An error occurred during adding of the record: {e}")
 
 
 """Function for deleting payment records from the payments table based on student id"""
-def delete_pay_record(stu_id,pd_date):
-    conn = create_connection()
-    cursor = conn.cursor()
-    cursor.execute(f"SELECT stu_name FROM students WHERE stu_id = {stu_id}")
-    stu_name = cursor.fetchall()[0]
+def delete_pay_record(stu_id,pd_date,stu_name=None):
+    conn = get_conn()
+    # name the student in the messages only when the caller already knows it
+    who = stu_name.strip() if stu_name else f"student ID {stu_id}"
     # try catch exception errors for SQL execution
     try:
-        cursor.execute("DELETE FROM payments WHERE stu_id = ? AND pd_date = ?",(stu_id,pd_date))
+        with savepoint(conn):
+            cursor = conn.execute(SQL_DEL_PAY, (stu_id,date_ordinal(pd_date)))
         del_rows_count = cursor.rowcount
         if del_rows_count > 0:
-            print("Successfully deleted", stu_name[0].strip(),"'s payment records.")
+            print(f"Successfully deleted {who}'s payment records.")
         else:
-            print(f"There were no records deleted for {stu_name[0].strip()} with transaction date of {pd_date}.")
-        conn.commit() 
+            print(f"There were no records deleted for {who} with transaction date of {pd_date}.")
     # try catch exception errors for SQL execution
     except sqlite3.Error as e: 
         print(f"An error occurred during deletion: {e}")
-        conn.rollback() # Rollback if an error occurred
-    conn.close()
 
 def pay_add():
     stu_id = input("Enter student's ID: ")
@@ -116,9 +126,10 @@ def pay_add():
     pd_date=date_valid(pd_date)
     add_pay_record(stu_id,amount,pd_date)
 
-def pay_del():
-    stu_id = input("Enter student's ID: ")
-    stu_id=chk_int(stu_id)
+def pay_del(stu_id=None, stu_name=None):
+    if stu_id is None:
+        stu_id = input("Enter student's ID: ")
+        stu_id=chk_int(stu_id)
     pd_date = input("Enter date amount was paid (YYYY-MM-DD): ")
     pd_date=date_valid(pd_date)
-    delete_pay_record(stu_id,pd_date)
\ No newline at end of file
+    delete_pay_record(stu_id,pd_date,stu_name)
\ No newline at end of file
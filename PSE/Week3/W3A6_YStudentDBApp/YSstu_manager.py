@@ -7,73 +7,108 @@ YSstu_manager.py - Week 3 Activity 6 - W3A6 - EJI
 Eduardo JR Ilagan
 """
 
-from YSDatabase import create_connection
+import sys
+from YSDatabase import get_conn,iter_rows,savepoint
+from YSdisplay import print_rows,print_cursor
+from YSvalidations import ask_yn,chk_int,ordinal_date
 import sqlite3
 
+"""Student queries kept as constants so the connection's statement cache reuses them"""
+SQL_ADD_STUDENT = "INSERT INTO students (stu_name, stu_addr) VALUES (?, ?)"
+SQL_VIEW_STUDENT = "SELECT * FROM students WHERE stu_name LIKE ?"
+# names starting with the input come first through the stu_name index, then the rest of the contains-matches
+SQL_VIEW_STUDENT_PREFIX = """SELECT * FROM students WHERE stu_name LIKE ?2
+                             UNION ALL
+                             SELECT * FROM students WHERE stu_name LIKE ?1 AND stu_name NOT LIKE ?2"""
+SQL_STUNAME_BY_ID = "SELECT stu_name FROM students WHERE stu_id = ?"
+SQL_STUREC_BY_ID = "SELECT * FROM students WHERE stu_id = ?"
+SQL_DEL_STUDENT = "DELETE FROM students WHERE stu_id = ?"
+SQL_CHECK_PAY = """SELECT s.stu_id,
+                            s.stu_name,
+                            p.tran_id,
+                            p.amount,
+                            p.pd_date_int
+                       FROM students s
+                       JOIN payments p ON p.stu_id = s.stu_id
+                      WHERE s.stu_id = ?
+"""
+
+"""Function for the Add Student menu option"""
+def stu_add():
+    stu_name = input("Name: ")
+    stu_addr = input("Addres: ")
+    add_student(stu_name, stu_addr)
+
+"""Function for the View Student menu option"""
+def stu_view():
+    stu_name = input("Enter Name: ")
+    rows=view_student(stu_name)
+    print_cursor(rows)
+
+"""Function for the Delete Student menu option"""
+def stu_del():
+    if ask_yn("Do you know the details of the record you wish to delete?"):
+        if ask_yn("Do you know the student's ID?"):
+            stu_id = input("Enter Student's ID: ")
+            delete_student(stu_id)
+        else:
+            stu_name = input("Enter Name: ")
+            rows=view_student(stu_name)
+            print_cursor(rows)
+            print("Please take note of Student's ID")
+            stu_id = input("Enter Student's ID: ")
+            delete_student(stu_id)
+    else:
+        stu_name=input("Get the details of the student by searching by the student's name:" )
+        rows=view_student(stu_name)
+        print_cursor(rows)
+        print("Please take note of Student's ID")
+        stu_id = input("Enter student's ID: ")
+        delete_student(stu_id)
+
+"""Function for the Check for Student Payment menu option"""
+def stu_pay_check():
+    if ask_yn("Do you know the student's ID?"):
+        stu_id = chk_int(input("Enter student's ID: "))
+        rows=view_sturec_vid(stu_id)
+        print_rows(rows)
+        # the record just fetched already has the name, so pay_check_func need not look it up again;
+        # no rows means no such student (view_sturec_vid has said so), so there is nothing to check
+        if rows:
+            pay_check_func(stu_id, rows[0][1])
+    else:
+        stu_name = input("Enter student's name: ")
+        # keep the listed rows by id so the chosen student's name is known without another SELECT
+        rows_by_id = {row[0]: row for row in view_student(stu_name)}
+        print_rows(list(rows_by_id.values()))
+        if not rows_by_id:
+            print(f"There are no records for Student's name: '{stu_name}' ")
+        else:
+            print("Please take note of Student's ID")
+            stu_id = chk_int(input("Enter student's ID: "))
+            chosen = rows_by_id.get(stu_id)
+            if chosen:
+                pay_check_func(stu_id, chosen[1])
+            else:
+                print(f"There is no student with ID {stu_id} in the records listed.")
+
+MENU_01_ACTIONS = {"1": stu_add, "2": stu_view, "3": stu_del, "4": stu_pay_check}
+
+MENU_01_BANNER = ("\n==== Yoobee Student Menu ====\n"
+                  "1. Add Student\n"
+                  "2. View Student\n"
+                  "3. Delete Student Record\n"
+                  "4. Check for Student Payment\n"
+                  "5. Go Back to Last Menu\n")
+
 """Function for the Student Menu"""
 def menu_01_stu():
     while True:
-        print("\n==== Yoobee Student Menu ====")
-        print("1. Add Student")
-        print("2. View Student")
-        print("3. Delete Student Record")
-        print("4. Check for Student Payment")
-        print("5. Go Back to Last Menu")
+        sys.stdout.write(MENU_01_BANNER)
         m01_choice = input("Select an option (1-4):")
-        if m01_choice == "1":
-            stu_name = input("Name: ")
-            stu_addr = input("Addres: ")
-            add_student(stu_name, stu_addr)
-        elif m01_choice == "2":
-            stu_name = input("Enter Name: ")
-            search=view_student(stu_name)
-            for search in search:
-                print(search)
-        elif m01_choice == "3":
-            rec_info_check = input("Do you know the details of the record you wish to delete? (Y/N): ").upper()
-            if rec_info_check == "Y":
-                stuid_check = input("Do you know the student's ID? (Y/N)").upper()
-                if stuid_check == "Y":
-                    stu_id = input("Enter Student's ID: ")
-                    delete_student(stu_id)
-                else:
-                    stu_name = input("Enter Name: ")
-                    search=view_student(stu_name)
-                    for search in search:
-                        print(search)
-                    print("Please take note of Student's ID")
-                    delete_student(stu_id)
-            else:
-                stu_name=input("Get the details of the student by searching by the student's name:" )
-                search=view_student(stu_name)
-                for search in search:
-                    print(search)
-                print("Please take note of Student's ID")
-                stu_id = input("Enter student's ID: ")
-                delete_student(stu_id)
-        elif m01_choice == "4":
-            pay_check = input("Do you know the student's ID? (Y/N)").upper()
-            if pay_check == "Y":
-                stu_id = input("Enter student's ID: ")
-                int(stu_id)
-                search=view_sturec_vid(stu_id)
-                for search in search:
-                    print(search)
-                if search == "":
-                    print("There are no records for Student's name: '{stu_name}' ")
-                pay_check_func(stu_id)
-            else:
-                stu_name = input("Enter student's name: ")
-                search=view_student(stu_name)
-                for search in search:
-                    print(search)
-                if search == "":
-                    print("There are no records for Student's name: '{stu_name}' ")
-                else:
-                    print("Please take note of Student's ID")
-                    stu_id = input("Enter student's ID: ")
-                    int(stu_id)
-                    pay_check_func(stu_id)
+        action = MENU_01_ACTIONS.get(m01_choice)
+        if action:
+            action()
         elif m01_choice == "5":
             print("Going back to Main Menu.")
             break
@@ -84,114 +119,105 @@ def menu_01_stu():
 
 """Function for adding student records"""
 def add_student(stu_name, stu_addr):
-    conn = create_connection()
-    cursor = conn.cursor()
+    add_student_many([(stu_name, stu_addr)])
+
+"""Function for adding several student records in a single transaction"""
+def add_student_many(rows):
+    conn = get_conn()
     try:
-        cursor.execute("INSERT INTO students (stu_name, stu_addr) VALUES (?, ?)", (stu_name, stu_addr))
-        conn.commit()
+        with savepoint(conn):
+            conn.executemany(SQL_ADD_STUDENT, rows)
         print(" Student Record added successfully.")
     except sqlite3.Error as e: 
         print(f"An error occurred during adding record: {e}")
-        conn.rollback() # Rollback if an error occurred
-    conn.close()
 
 
 """Function for checking payment records."""
-def pay_check_func(stu_id):
+def pay_check_func(stu_id, stu_name=None):
     paydet=check_stu_pay(stu_id)
     if paydet:
         print("Here are the details: ",paydet[0] )
     else:
-        stu_name=view_stuname_vid(stu_id)
-        print(f"There are no payment records for {stu_name[0]} to delete.")
+        if stu_name is None:
+            stu_name=view_stuname_vid(stu_id)[0]
+        print(f"There are no payment records for {stu_name} to delete.")
 
-"""Function for viewing student records based on Student Name wild card search"""
+"""Function for viewing student records based on Student Name wild card search.
+Every name containing the input is returned; names starting with it (an exact
+name included) are listed first, found through the stu_name index.
+Yields the matching rows as they are fetched instead of returning a list."""
 def view_student(stu_name):
-    conn = create_connection()
-    cursor = conn.cursor()
-    cursor.execute("SELECT * FROM students WHERE stu_name LIKE ?", ('%' + stu_name + '%',))
-    rows = cursor.fetchall()
-    if rows :
+    cursor = get_conn().cursor()
+    # rows carry their column names so the header is printed along with them
+    cursor.row_factory = sqlite3.Row
+    if "%" not in stu_name and "_" not in stu_name:
+        sql = SQL_VIEW_STUDENT_PREFIX
+        cursor.execute(sql, ('%' + stu_name + '%', stu_name + '%'))
+    else:
+        sql = SQL_VIEW_STUDENT
+        cursor.execute(sql, ('%' + stu_name + '%',))
+    first_row = cursor.fetchone()
+    if first_row is not None:
         print("Record found from students table.")
     else:
         print(f"No record for '{stu_name}' exists.")
-    conn.close()
-    if cursor.description:
-        column_aliases = [description[0] for description in cursor.description]
-    else:
-        print("No cursor description available.")
-    # Fetch and print data using aliases as headers
-    print(column_aliases)
-    return rows
+    if first_row is None:
+        return
+    yield first_row
+    yield from iter_rows(cursor)
 
 """Function for viewing student Student Name based on Student Id search"""
 def view_stuname_vid(stu_id):
-    conn = create_connection()
+    conn = get_conn()
     cursor = conn.cursor()
-    cursor.execute(f"SELECT stu_name FROM students WHERE stu_id = {stu_id} ")
+    cursor.execute(SQL_STUNAME_BY_ID, (stu_id,))
     rows = cursor.fetchall()
     if rows :
         stu_name = rows[0]
         print(f"Record found for student {stu_name[0]} in the students records.")
     else:
         print(f"No record for student id'{stu_id}' exists.")
-    conn.close()
     return rows[0]
 
 
 def view_sturec_vid(stu_id):
-    conn = create_connection()
+    conn = get_conn()
     cursor = conn.cursor()
-    cursor.execute(f"SELECT * FROM students WHERE stu_id = {stu_id} ")
+    cursor.execute(SQL_STUREC_BY_ID, (stu_id,))
     rows = cursor.fetchall()
     if rows :
         stu_name = rows[0]
         print(f"Record found for student {stu_name[0]} in the students records.")
     else:
         print(f"No record for student id'{stu_id}' exists.")
-    conn.close()
     return rows
 
 """Function for deleting student records based on Student ID """
 def delete_student(stu_id):
-    conn = create_connection()
-    cursor = conn.cursor()
+    conn = get_conn()
     try:
-        cursor.execute("DELETE FROM students WHERE stu_id = ?", (stu_id))
+        with savepoint(conn):
+            cursor = conn.execute(SQL_DEL_STUDENT, (stu_id,))
         ins_row_count = cursor.rowcount
         if ins_row_count > 0:
             print("Successfully deleted student id ", stu_id,"from the record.")
         else:
             print(" There were no records deleted. Student ID ",stu_id," is not in the records.")
-        conn.commit()
     except sqlite3.Error as e: 
         print(f"An error occurred during deletion: {e}")
-        conn.rollback() # Rollback if an error occurred
-    conn.close()
 
 """Function for checking student payment records based on Student ID .
 Query from payemnts and students table."""
 def check_stu_pay(stu_id):
-    conn = create_connection()
+    conn = get_conn()
     cursor = conn.cursor()
-    search_query = f"""SELECT s.stu_id,
-                                s.stu_name,
-                                p.tran_id,
-                                p.amount,
-                                pd_date
-                           FROM students s, 
-                                payments p 
-                          WHERE s.stu_id = p.stu_id 
-                            AND s.stu_id = {stu_id}
-                            
-                    """
-    cursor.execute(search_query)
-    rows = cursor.fetchall()
+    cursor.execute(SQL_CHECK_PAY, (stu_id,))
+    # turn the stored day ordinal back into YYYY-MM-DD for display
+    rows = [row[:4] + (ordinal_date(row[4]) if row[4] is not None else None,) for row in cursor]
     if rows:
         print(f"Payment records found for student ID: {stu_id}")
     else:
         print(f"There are no payment records found for student ID: {stu_id}")
-    conn.close()
     return rows
 
 
@@ -6,32 +6,46 @@ Share the completed project on GitHub here, with including a README.txt file in
 YSvalidations.py - Week 3 Activity 6 - W3A6 - EJI
 Eduardo JR Ilagan
 """
-from datetime import datetime
+import re
+from datetime import date, datetime
+
+# [0-9] rather than \d, which also matches non-ASCII digits that date.fromisoformat rejects
+DATE_RE = re.compile(r"([0-9]{4})-([0-9]{2})-([0-9]{2})")
 
 """Validation functions for user inputs"""
-# integer validation input - validates if the user input for the integer is indeed a positive number
+# integer validation input - validates if the user input for the integer is indeed a whole number, asking again until it is
 def chk_int(int_val):
     while True:
-        try:
-            int_val = int(int_val)
-            return int_val
-        except ValueError:
-            print("Invalid input. Please enter a whole number.")
+        int_val = int_val.strip()
+        if int_val.isdecimal() or (int_val.startswith("-") and int_val[1:].isdecimal()):
+            return int(int_val)
+        int_val = input("Invalid input. Please enter a whole number: ")
+
+# yes/no input - asks the question and returns True only when the user answers Y
+def ask_yn(question):
+    return input(question + " (Y/N): ").strip().upper() == "Y"
 
 # date validation input - validates if the user input for the date is in the correct format
 def date_valid(pd_date):
-    pd_date_chk = date_check(pd_date)
-    while pd_date_chk == False: 
+    while not date_check(pd_date):
         pd_date = input("Incorrect Date format Entered: Please enter date with this format YYYY-MM-DD: ")
-        pd_date_chk = date_check(pd_date)
-        if pd_date_chk == True:
-            break
     return pd_date
 
+# the regex rejects badly formatted input without raising; the datetime constructor then checks the day exists
 def date_check(pd_date):
+    match = DATE_RE.fullmatch(pd_date)
+    if match is None:
+        return False
+    year, month, day = map(int, match.groups())
     try:
-        is_date = datetime.strptime(pd_date, "%Y-%m-%d")
-        return True
-        #print(is_date)
+        datetime(year, month, day)
     except ValueError:
         return False
+    return True
+
+# date conversion - payment dates are stored as day ordinals (date.toordinal()) and shown as YYYY-MM-DD
+def date_ordinal(pd_date):
+    return date.fromisoformat(pd_date).toordinal()
+
+def ordinal_date(pd_date_int):
+    return date.fromordinal(pd_date_int).isoformat()
@@ -27,13 +27,13 @@ def check_tables():
 
     conn = create_connection()
     cursor = conn.cursor()
-    rows = cursor.execute(f"SELECT * FROM instructors ")
+    rows = cursor.execute("SELECT * FROM instructors ")
     print(cursor.fetchall())
     column_aliases = [description[0] for description in cursor.description]
-    cursor.execute(f"SELECT * FROM subjects")
+    cursor.execute("SELECT * FROM subjects")
     print(cursor.fetchall())
     column_aliases = [description[0] for description in cursor.description]
-    cursor.execute(f"SELECT * FROM class_records")
+    cursor.execute("SELECT * FROM class_records")
     print(cursor.fetchall())
     column_aliases = [description[0] for description in cursor.description]
 #from datetime import datetime
@@ -51,7 +51,7 @@ def check_query(clsrec_stuid):
     conn = create_connection()
     cursor = conn.cursor()
     search_pattern = f"{clsrec_stuid}"
-    search_query = f"""SELECT st.stu_name Student,
+    search_query = """SELECT st.stu_name Student,
                                 cl.stu_id clstuid,
                                 cl.inst_id clinstid,
                                 cl.sbjt_id clsbjtid,
@@ -61,10 +61,9 @@ def check_query(clsrec_stuid):
                                 subjects s
                           WHERE cl.stu_id = st.stu_id
                             AND cl.sbjt_id = s.sbjt_id
+                            AND cl.stu_id = ?
                     """
-    cursor.execute(search_query)
-    #,(search_pattern,)
-    #      AND cl.stu_id = ?                      
+    cursor.execute(search_query,(search_pattern,))
     # Get Column Names (Aliases) from cursor.description
     rows = cursor.fetchall()
     if rows :
@@ -85,10 +84,10 @@ def main():
     check_tables()
     #check_stu_pay(1)
     clsrec_stuid = "4"
-    search=check_query(clsrec_stuid)
+    rows=check_query(clsrec_stuid)
 
-    for search in search:
-        print(search)
+    for row in rows:
+        print(row)
     #pd_date = input("Enter date amount was paid (YYYY-MM-DD): ")
     #pd_date_chk = date_check(pd_date)
     #while pd_date_chk == False: 
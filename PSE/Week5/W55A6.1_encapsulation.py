@@ -4,6 +4,8 @@ Also, please create a new class to demonstrate the use of the public and protect
 """
 
 class Student:
+    __slots__ = ('name', '_age', '__grade')  # no per-instance __dict__; '__grade' is mangled to '_Student__grade'
+
     def __init__(self, name, age):
         self.name = name       # public
         self._age = age        # protected
@@ -23,6 +25,8 @@ class Student:
         return self._age
 
 class Instructor:
+    __slots__ = ('name', '_age', '__inst_id')  # no per-instance __dict__
+
     def __init__(self, name, age):
         self.name = name       # public
         self._age = age        # protected
@@ -41,7 +45,7 @@ print(s.name)         # accessible
 print(s._age)         # discouraged
 print(s.get_grade())  # correct way
 print("Assigninig to Private Variable")
-#s.__grade = "B"  # Assigning new value for the grade does not work as it takes it as a new variable and not the one declared in the class
+#s.__grade = "B"  # Assigning new value for the grade does not work as it is not the one declared in the class; with __slots__ it raises AttributeError
 #print(s.__grade) # Checking for if the value was assinged to the private varaiable, it was not. The variablel is not accessible.
 print(s.chng_grade()) # New method can access the private variable to be changed.
 print("After Method to update Private Variable")
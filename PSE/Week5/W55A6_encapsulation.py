@@ -1,4 +1,6 @@
 class Student:
+    __slots__ = ('name', '_age', '__grade')  # no per-instance __dict__; '__grade' is mangled to '_Student__grade'
+
     def __init__(self, name, age):
         self.name = name       # public
         self._age = age        # protected
@@ -1,5 +1,8 @@
 #learning about overriding methods
 
+# INSERT statements already built, keyed by (table, columns)
+_STMT_CACHE = {}
+
 class User:
     def __init__ (self, name, addr, age):
         self.name = name
@@ -19,11 +22,14 @@ class student(User):
         self.sbjt_id = sbjt_id
         
     def insrec(self,tbl_nme,stu_dtl):
-        tbl_col = ", ".join(stu_dtl.keys())
-        plchldrs = ", ".join(['?'] * len(stu_dtl))
         col_val = tuple(stu_dtl.values())
-        tbl_nme = tbl_nme
-        ins_query = f"INSERT INTO {tbl_nme} ({tbl_col}) VALUES ({plchldrs}))"
+        # the query only depends on the table and columns, so it is built once per pair
+        key = (tbl_nme, tuple(stu_dtl))
+        ins_query = _STMT_CACHE.get(key)
+        if ins_query is None:
+            tbl_col = ", ".join(key[1])
+            plchldrs = ", ".join(['?'] * len(key[1]))
+            ins_query = _STMT_CACHE[key] = f"INSERT INTO {tbl_nme} ({tbl_col}) VALUES ({plchldrs})"
         print(f"This is the insert query: cursor.execute({ins_query} , {col_val})")
 
     def add_student(self):
@@ -46,7 +46,7 @@ def insrec(tbl_nme,stu_dtl):
     plchldrs = ", ".join(['?'] * len(stu_dtl))
     col_val = tuple(stu_dtl.values())
     tbl_nme = tbl_nme
-    ins_query = f"INSERT INTO {tbl_nme} ({tbl_col}) VALUES ({plchldrs}))"
+    ins_query = f"INSERT INTO {tbl_nme} ({tbl_col}) VALUES ({plchldrs})"
     print(ins_query)
     print(col_val)
     try:
@@ -57,7 +57,8 @@ def insrec(tbl_nme,stu_dtl):
     except sqlite3.Error as e: 
         print(f"An error occurred during adding record: {e}")
         conn.rollback() # Rollback if an error occurred
-    conn.close()
+    finally:
+        conn.close() # Runs on success too, the return above used to skip it
 
 def add_user():
     stu_name = "Harry Potter"
@@ -1,102 +1,149 @@
+import queue
 import sqlite3
 import time 
+from contextlib import contextmanager
 
-def create_connection():
-    conn = sqlite3.connect("app.db")
-    return conn
+class PooledConnection(sqlite3.Connection):
+    """Connection that carries one cursor reused by every query on it.
+    Safe because the pool lends a connection to one caller at a time"""
+    shared_cursor = None
+
+class ConnectionPool:
+    """Opens a fixed number of connections up front and lends them out,
+    so each database call reuses an open connection (and its page cache)"""
+    def __init__(self, dsn, size=4):
+        self._q = queue.Queue()
+        for _ in range(size):
+            conn = sqlite3.connect(dsn, check_same_thread=False, factory=PooledConnection)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA temp_store=MEMORY")
+            conn.execute("PRAGMA cache_size=-64000")
+            conn.shared_cursor = conn.cursor()
+            self._q.put(conn)
+
+    @contextmanager
+    def get(self):
+        conn = self._q.get()
+        try:
+            yield conn
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            self._q.put(conn)
+
+    def close(self):
+        while not self._q.empty():
+            self._q.get_nowait().close()
+
+POOL = ConnectionPool("app.db")
 
 class UserService:
     def get_user(self, user_id,conn):
-        cursor = conn.cursor()
-        cursor.execute("SELECT * FROM users WHERE id = ?", (user_id, ))
-        result = cursor. fetchone ()
-        return result
+        return conn.shared_cursor.execute("SELECT * FROM users WHERE id = ?", (user_id, )).fetchone()
 
 # New connection
 
 class OrderService:
     def get_orders(self, user_id,conn):
-        create_connection() # Another new connection
-        cursor = conn.cursor()
-        cursor.execute("SELECT * FROM orders WHERE user_id = ?", (user_id,))
-        result = cursor. fetchall()
+        return conn.shared_cursor.execute("SELECT * FROM orders WHERE user_id = ?", (user_id,)).fetchall()
+
 
+# Both tables in one script so setup is a single call
+DDL = """
+    CREATE TABLE IF NOT EXISTS users (
+        user_id INTEGER PRIMARY KEY AUTOINCREMENT,
+        user_name TEXT NOT NULL,
+        user_addr TEXT NOT NULL
+    );
+    CREATE TABLE IF NOT EXISTS orders (
+        ord_id INTEGER PRIMARY KEY AUTOINCREMENT,
+        ord_name TEXT NOT NULL,
+        ord_stat TEXT NOT NULL
+    );
+"""
 
 def create_tables():
-    conn = sqlite3.connect('app.db')
-    cursor = conn.cursor()
-    """Creates the table for user"""
-    cursor.execute('''
-        CREATE TABLE IF NOT EXISTS users (
-            user_id INTEGER PRIMARY KEY AUTOINCREMENT,
-            user_name TEXT NOT NULL,
-            user_addr TEXT NOT NULL
-        )    ''')
-    ('''
-        CREATE TABLE IF NOT EXISTS orders (
-            ord_id INTEGER PRIMARY KEY AUTOINCREMENT,
-            ord_name TEXT NOT NULL,
-            ord_stat TEXT NOT NULL
-        )    ''')
-
-    conn.commit()
-    conn.close()
+    """Creates the tables for users and orders"""
+    with POOL.get() as conn:
+        conn.executescript(DDL)
+        conn.commit()
+
+# INSERT statements already built, keyed by (table, columns)
+_STMT_CACHE = {}
+
+def insert_sql(tbl_nme,cols):
+    """Builds the INSERT for a table and column set the first time it is needed
+    and hands back the same string afterwards"""
+    key = (tbl_nme, tuple(cols))
+    ins_query = _STMT_CACHE.get(key)
+    if ins_query is None:
+        tbl_col = ", ".join(key[1])
+        plchldrs = ", ".join(['?'] * len(key[1]))
+        ins_query = _STMT_CACHE[key] = f"INSERT INTO {tbl_nme} ({tbl_col}) VALUES ({plchldrs})"
+    return ins_query
 
 def insrec(tbl_nme,stu_dtl):
-    conn = sqlite3.connect('app.db')
-    cursor = conn.cursor()
-    tbl_col = ", ".join(stu_dtl.keys())
-    plchldrs = ", ".join(['?'] * len(stu_dtl))
     col_val = tuple(stu_dtl.values())
-    tbl_nme = tbl_nme
-    ins_query = f"INSERT INTO {tbl_nme} ({tbl_col}) VALUES ({plchldrs}))"
+    ins_query = insert_sql(tbl_nme,stu_dtl)
     print(ins_query)
     print(col_val)
+    with POOL.get() as conn:
+        cursor = conn.shared_cursor
+        try:
+            cursor.execute(ins_query, tuple(col_val))
+            afct_rows = cursor.rowcount
+            conn.commit()
+            return afct_rows
+        except sqlite3.Error as e: 
+            print(f"An error occurred during adding record: {e}")
+            conn.rollback() # Rollback if an error occurred
+
+def bulk_insert(conn,tbl_nme,col_names,rows_iter):
+    """Adds every row in one transaction with a single executemany"""
+    ins_query = insert_sql(tbl_nme,col_names)
     try:
-        cursor.execute(ins_query, tuple(col_val))
+        conn.execute("BEGIN")
+        cursor = conn.shared_cursor.executemany(ins_query, rows_iter)
         afct_rows = cursor.rowcount
         conn.commit()
         return afct_rows
-    except sqlite3.Error as e: 
-        print(f"An error occurred during adding record: {e}")
+    except sqlite3.Error as e:
+        print(f"An error occurred during adding records: {e}")
         conn.rollback() # Rollback if an error occurred
-    conn.close()
 
-def add_user():
-    stu_name = "Harry Potter"
-    stu_addr = "Privet Drive"
-    stu_dtl = {'user_name':stu_name,'user_addr':stu_addr}
+def add_user(users=(("Harry Potter", "Privet Drive"),)):
     tbl_nme = 'users'
-    afct_rows = insrec(tbl_nme,stu_dtl)
+    with POOL.get() as conn:
+        afct_rows = bulk_insert(conn,tbl_nme,('user_name','user_addr'),users)
     if afct_rows:
-        print(f"User '{stu_name}' added successfully.")
+        print(f"{afct_rows} User(s) added successfully.")
     else:
-        print(f"Failed to add User '{stu_name}'.")
+        print("Failed to add Users.")
 
 
-def add_order():
-    stu_name = "Wand Order"
-    stu_addr = "Y"
-    stu_dtl = {'ord_name':stu_name,'ord_stat':stu_addr}
-    tbl_nme = 'users'
-    afct_rows = insrec(tbl_nme,stu_dtl)
+def add_order(orders=(("Wand Order", "Y"),)):
+    tbl_nme = 'orders'
+    with POOL.get() as conn:
+        afct_rows = bulk_insert(conn,tbl_nme,('ord_name','ord_stat'),orders)
     if afct_rows:
-        print(f"Order '{stu_name}' added successfully.")
+        print(f"{afct_rows} Order(s) added successfully.")
     else:
-        print(f"Failed to add UsOrderer '{stu_name}'.")
+        print("Failed to add Orders.")
 
 def main():
     start = time.perf_counter_ns()
     #create_tables()
     #add_user()
     #add_order()
-    conn=create_connection()
-    u = UserService()
-    #print(u)
-    o = OrderService()
-    #print(o)
+    with POOL.get() as conn:
+        u = UserService()
+        #print(u)
+        o = OrderService()
+        #print(o)
     end = time.perf_counter_ns()
-    conn.close()
+    POOL.close()
     print(end-start)
 
 if __name__ == "__main__":
@@ -12,6 +12,7 @@ Sample_code.py
 
 # New Code - EJI
 from abc import ABC, abstractmethod
+import sys
 
 # 1) Abstract Product
 class Shape(ABC):
@@ -38,20 +39,30 @@ class ShapeFactory:
         "circle": Circle,
         "square": Square,
     }
+    _alias = dict(_registry)   # names exactly as registered, checked before lowercasing
 
     @classmethod
     def register(cls, name: str, shape_cls: type[Shape]) -> None:
         """Optionally register new shapes without modifying factory code."""
         if not issubclass(shape_cls, Shape):
             raise TypeError("Registered class must inherit from Shape")
-        cls._registry[name.lower()] = shape_cls
+        # interned keys let lowercase literals match on identity in the dict probe
+        key = sys.intern(name.lower())
+        cls._registry[key] = shape_cls
+        # earlier spellings of the same shape must not keep pointing at the old class
+        for alias in [alias for alias in cls._alias if alias.lower() == key]:
+            del cls._alias[alias]
+        cls._alias[key] = shape_cls
+        cls._alias[sys.intern(name)] = shape_cls
 
     @classmethod
     def create(cls, shape_type: str) -> Shape:
-        shape_cls = cls._registry.get(shape_type.lower())
+        shape_cls = cls._alias.get(shape_type)
         if shape_cls is None:
-            raise ValueError(f"Unknown shape type: {shape_type!r}. "
-                             f"Available: {', '.join(cls._registry)}")
+            shape_cls = cls._registry.get(shape_type.lower())
+            if shape_cls is None:
+                raise ValueError(f"Unknown shape type: {shape_type!r}. "
+                                 f"Available: {', '.join(cls._registry)}")
         return shape_cls()
 
 class Triangle(Shape):
@@ -22,25 +22,35 @@ from __future__ import annotations # learned what annotations. type annotations
 from abc import ABC, abstractmethod
 from dataclasses import dataclass # learned what a decorator is and how to make the class immutable by using frozen
 from typing import Any, Dict,Type, Callable # learned what hint annotaions are and how it can be used for better coding.
-import uuid   # learned what this module is for, use to crate unique IDs
+from os import environ, urandom   # random bytes for unique IDs, hex of 16 bytes is as unique as a uuid4 without building a UUID object
 import time   # module that is used to work on time related tasks.
 import threading
+import sys
+
+# capture() delays only mimic a real provider; set PAY_SIMULATE=1 to turn them on
+_SIMULATE_LATENCY = bool(int(environ.get("PAY_SIMULATE", "0")))
 
 # ────────────────────────────────────────────────────────────────────────────────
 # Singleton for Payment Gateway
 # ────────────────────────────────────────────────────────────────────────────────
 
+_MISSING = object()   # sentinel so a stored instance is never confused with "not built yet"
+
 class _S(type):
-    """Thread-safe Singleton metaclass (double-checked locking)."""
+    """Thread-safe Singleton metaclass (double-checked locking).
+    Once the instance exists it is returned from a single dict.get without taking the lock."""
     _instances = {}
     _lock = threading.Lock()
 
     def __call__(cls, *args, **kwargs):
-        if cls not in cls._instances:
+        inst = cls._instances.get(cls, _MISSING)
+        if inst is _MISSING:
             with cls._lock:
-                if cls not in cls._instances:
-                    cls._instances[cls] = super(_S, cls).__call__(*args, **kwargs)
-        return cls._instances[cls]
+                inst = cls._instances.get(cls, _MISSING)
+                if inst is _MISSING:
+                    inst = super(_S, cls).__call__(*args, **kwargs)
+                    cls._instances[cls] = inst
+        return inst
 
 class PaymentGateway(metaclass=_S):
     """Main entry point for payments. Only one instance exists."""
@@ -83,14 +93,14 @@ class PaymentGateway(metaclass=_S):
 # Class for Facotory at PaymentRequests
 # classes are frozen to be immutable.
 # ────────────────────────────────────────────────────────────────────────────────
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PaymentRequest:
     method: str                # e.g., "creditcard", "paypal", "bank_transfer", "crypto", "googlepay"
     amount: float
     currency: str              # "NZD", "USD", etc.
     metadata: Dict[str, Any]   # method-specific fields (card details, wallet id, etc.)
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Receipt:
     payment_id: str
     status: str                # "authorized", "captured", "failed"
@@ -104,8 +114,9 @@ class Receipt:
 # ────────────────────────────────────────────────────────────────────────────────
 class PaymentMethod(ABC):
     """Common interface all payment methods must implement."""
+    __slots__ = ("amount", "currency", "metadata")   # no per-instance __dict__
 
-    def __init__(self, amount: float, currency: str, metadata: Dict[str, Any]) -> None:
+    def __init__(self, amount: float, currency: str, metadata: Dict[str, Any], /) -> None:
         self.amount = amount
         self.currency = currency
         self.metadata = metadata
@@ -132,33 +143,41 @@ class PaymentMethod(ABC):
 class PaymentFactory:
     """Creates payment-method objects dynamically based on a method name."""
     _registry: Dict[str, Type[PaymentMethod]] = {}
+    _alias: Dict[str, Type[PaymentMethod]] = {}   # names exactly as registered, skips _norm
+    _TRANS = str.maketrans("", "", " _-")         # drops spaces/underscores/hyphens in one pass
 
-    @staticmethod
-    def _norm(name: str) -> str:
+    @classmethod
+    def _norm(cls, name: str) -> str:
         # normalize: lowercase, remove spaces/underscores/hyphens
-        return name.lower().replace(" ", "").replace("_", "").replace("-", "")
+        return name.lower().translate(cls._TRANS)
 
     @classmethod
     def register(cls, method_name: str) -> Callable[[Type[PaymentMethod]], Type[PaymentMethod]]:
         """Decorator to register new payment classes: @PaymentFactory.register('creditcard')."""
         def _inner(klass: Type[PaymentMethod]) -> Type[PaymentMethod]:
-            cls._registry[cls._norm(method_name)] = klass
+            cls.add(method_name, klass)
             return klass
         return _inner
 
     @classmethod
     def add(cls, method_name: str, klass: Type[PaymentMethod]) -> None:
         """Alternate non-decorator way to register."""
-        cls._registry[cls._norm(method_name)] = klass
+        key = cls._norm(method_name)
+        cls._registry[key] = klass
+        # earlier spellings of the same method must not keep pointing at the old class
+        for name in [name for name in cls._alias if cls._norm(name) == key]:
+            del cls._alias[name]
+        cls._alias[method_name] = klass
 
     @classmethod
     def create(cls, method_name: str, amount: float, currency: str, metadata: Dict[str, Any]) -> PaymentMethod:
-        key = cls._norm(method_name)
-        klass = cls._registry.get(key)
-        if not klass:
-            known = ", ".join(sorted(cls._registry.keys()))
-            raise ValueError(f"Unknown payment method '{method_name}'. Known: {known or '(none registered)'}")
-        return klass(amount=amount, currency=currency, metadata=metadata)
+        klass = cls._alias.get(method_name)
+        if klass is None:
+            klass = cls._registry.get(cls._norm(method_name))
+            if klass is None:
+                known = ", ".join(sorted(cls._registry.keys()))
+                raise ValueError(f"Unknown payment method '{method_name}'. Known: {known or '(none registered)'}")
+        return klass(amount, currency, metadata)   # positional-only __init__, no keyword parsing
     
 # ────────────────────────────────────────────────────────────────────────────────
 # Concrete classes that were added. I built this demo to be within the script. 
@@ -166,6 +185,8 @@ class PaymentFactory:
 # ────────────────────────────────────────────────────────────────────────────────
 @PaymentFactory.register("creditcard")    # Registers the class with a decorator as the class is within the same script, this will be a cleaner approach.
 class CreditCardPayment(PaymentMethod):
+    __slots__ = ()
+
     def authorize(self) -> Receipt:
         # check amount > 0
         self._require_positive_amount()
@@ -176,7 +197,7 @@ class CreditCardPayment(PaymentMethod):
             raise ValueError("Invalid card number")
 
         # simulate an authorization ID
-        auth_id = f"AUTH-CC-{uuid.uuid4()}" ## this is where the uuid was used in order to simulate a generated unique ID
+        auth_id = f"AUTH-CC-{urandom(16).hex()}" ## random hex is used in order to simulate a generated unique ID
 
         return Receipt(
             payment_id=auth_id,
@@ -189,10 +210,11 @@ class CreditCardPayment(PaymentMethod):
 
     def capture(self, authorization_id: str) -> Receipt:
         # simulate processing time
-        time.sleep(0.1)
+        if _SIMULATE_LATENCY:
+            time.sleep(0.1)
 
         return Receipt(
-            payment_id=f"CAP-CC-{uuid.uuid4()}",
+            payment_id=f"CAP-CC-{urandom(16).hex()}",
             status="captured",
             method="creditcard",
             amount=self.amount,
@@ -202,13 +224,15 @@ class CreditCardPayment(PaymentMethod):
 
 @PaymentFactory.register("paypal")    
 class PayPalPayment(PaymentMethod):
+    __slots__ = ()
+
     def authorize(self) -> Receipt:
         self._require_positive_amount()
         account = self.metadata.get("paypal_account")
         if not account:
             raise ValueError("Missing PayPal account")
 
-        auth_id = f"AUTH-PP-{uuid.uuid4()}"
+        auth_id = f"AUTH-PP-{urandom(16).hex()}"
         return Receipt(
             payment_id=auth_id,
             status="authorized",
@@ -219,9 +243,10 @@ class PayPalPayment(PaymentMethod):
         )
 
     def capture(self, authorization_id: str) -> Receipt:
-        time.sleep(0.05)
+        if _SIMULATE_LATENCY:
+            time.sleep(0.05)
         return Receipt(
-            payment_id=f"CAP-PP-{uuid.uuid4()}",
+            payment_id=f"CAP-PP-{urandom(16).hex()}",
             status="captured",
             method="paypal",
             amount=self.amount,
@@ -231,13 +256,15 @@ class PayPalPayment(PaymentMethod):
 
 @PaymentFactory.register("banktransfer")    
 class BankTransferPayment(PaymentMethod):
+    __slots__ = ()
+
     def authorize(self) -> Receipt:
         self._require_positive_amount()
         account = self.metadata.get("iban") or self.metadata.get("account_no")
         if not account:
             raise ValueError("Missing bank account info")
 
-        auth_id = f"AUTH-BT-{uuid.uuid4()}"
+        auth_id = f"AUTH-BT-{urandom(16).hex()}"
         return Receipt(
             payment_id=auth_id,
             status="authorized",
@@ -249,7 +276,7 @@ class BankTransferPayment(PaymentMethod):
 
     def capture(self, authorization_id: str) -> Receipt:
         return Receipt(
-            payment_id=f"CAP-BT-{uuid.uuid4()}",
+            payment_id=f"CAP-BT-{urandom(16).hex()}",
             status="captured",
             method="bank_transfer",
             amount=self.amount,
@@ -259,13 +286,15 @@ class BankTransferPayment(PaymentMethod):
 
 @PaymentFactory.register("crypto")    
 class CryptoPayment(PaymentMethod):
+    __slots__ = ()
+
     def authorize(self) -> Receipt:
         self._require_positive_amount()
         wallet = self.metadata.get("walletaddr")
         if not wallet:
             raise ValueError("Missing wallet address")
 
-        auth_id = f"AUTH-CR-{uuid.uuid4()}"
+        auth_id = f"AUTH-CR-{urandom(16).hex()}"
         return Receipt(
             payment_id=auth_id,
             status="authorized",
@@ -276,9 +305,10 @@ class CryptoPayment(PaymentMethod):
         )
 
     def capture(self, authorization_id: str) -> Receipt:
-        time.sleep(0.1)
+        if _SIMULATE_LATENCY:
+            time.sleep(0.1)
         return Receipt(
-            payment_id=f"CAP-CR-{uuid.uuid4()}",
+            payment_id=f"CAP-CR-{urandom(16).hex()}",
             status="captured",
             method="crypto",
             amount=self.amount,
@@ -288,13 +318,15 @@ class CryptoPayment(PaymentMethod):
 
 @PaymentFactory.register("googlepay")    
 class GooglePayPayment(PaymentMethod):
+    __slots__ = ()
+
     def authorize(self) -> Receipt:
         self._require_positive_amount()
         token = self.metadata.get("gpay_token")
         if not token:
             raise ValueError("Missing Google Pay token")
 
-        auth_id = f"AUTH-GP-{uuid.uuid4()}"
+        auth_id = f"AUTH-GP-{urandom(16).hex()}"
         return Receipt(
             payment_id=auth_id,
             status="authorized",
@@ -305,9 +337,10 @@ class GooglePayPayment(PaymentMethod):
         )
 
     def capture(self, authorization_id: str) -> Receipt:
-        time.sleep(0.02)
+        if _SIMULATE_LATENCY:
+            time.sleep(0.02)
         return Receipt(
-            payment_id=f"CAP-GP-{uuid.uuid4()}",
+            payment_id=f"CAP-GP-{urandom(16).hex()}",
             status="captured",
             method="googlepay",
             amount=self.amount,
@@ -315,100 +348,71 @@ class GooglePayPayment(PaymentMethod):
             message=f"Captured Google Pay authorization {authorization_id}."
         )
 
-if __name__ == "__main__":
-
+# ────────────────────────────────────────────────────────────────────────────────
+# CLI menu, written in one go, and one handler per option
+# ────────────────────────────────────────────────────────────────────────────────
+MENU = (
+    "===== Choose the Payment Method =====\n"
+    " 1 Cash\n"
+    " 2 Credit Card\n"
+    " 3 Bank Transfer\n"
+    " 4 Paypal\n"
+    " 5 Crypto\n"
+    " 6 Google Pay\n"
+    " 0 Cancel\n"
+)
+
+def _pay(pg: PaymentGateway, method: str, metadata: Dict[str, Any], label: str) -> None:
+    amt = float(input("Enter Amount: "))
+    request = PaymentRequest(
+        method=method,
+        amount=amt,
+        currency="NZD",
+        metadata=metadata # will be different for each payment method.
+    )
+    receipt = pg.process(request)
+    print(f"[{receipt.method}] {receipt.status.upper()} {receipt.amount} {receipt.currency} :: {receipt.message} (id={receipt.payment_id})")
+    print(f"{label} Payment Successful.")
+
+def _handle_cash(pg: PaymentGateway) -> None:
+    print("Cash Payment Successful.")
+
+def _handle_cc(pg: PaymentGateway) -> None:
+    # aliases like "creditcard", "credit_card" also work
+    _pay(pg, "credit-card", {"card_number": "4111111111111111"}, "Credit Card")
+
+def _handle_bt(pg: PaymentGateway) -> None:
+    _pay(pg, "banktransfer", {"iban": "123-459-786"}, "Bank Transfer")
+
+def _handle_pp(pg: PaymentGateway) -> None:
+    _pay(pg, "paypal", {"paypal_account": "paypal@account.com"}, "Paypal")
+
+def _handle_cr(pg: PaymentGateway) -> None:
+    _pay(pg, "crypto", {"walletaddr": "becd-opop-9089-oiui"}, "Crypto")
+
+def _handle_gp(pg: PaymentGateway) -> None:
+    _pay(pg, "googlepay", {"gpay_token": "user@gmail.com"}, "Google Pay")
+
+HANDLERS: Dict[str, Callable[[PaymentGateway], None]] = {
+    "1": _handle_cash,
+    "2": _handle_cc,
+    "3": _handle_bt,
+    "4": _handle_pp,
+    "5": _handle_cr,
+    "6": _handle_gp,
+}
+
+def main() -> None:
     pg = PaymentGateway()
     while True:
-        
-        print("===== Choose the Payment Method =====")
-        print(" 1 Cash")
-        print(" 2 Credit Card")
-        print(" 3 Bank Transfer")
-        print(" 4 Paypal")
-        print(" 5 Crypto")
-        print(" 6 Google Pay")
-        print(" 0 Cancel")
+        sys.stdout.write(MENU)
         pm = input("Enter Payment Method: ")
-        if pm == "1":
-            print("Cash Payment Successful.")
-        elif pm == "2":
-            amt = float(input("Enter Amount: "))
-            request = PaymentRequest(
-                method="credit-card",          # aliases like "creditcard", "credit_card" also work
-                amount=amt,
-                currency="NZD",
-                metadata={"card_number": "4111111111111111"}
-            )
-            processor = PaymentFactory.create(request.method, request.amount, request.currency, request.metadata)
-            auth = processor.authorize()
-            print(auth)
-            cap = processor.capture(auth.payment_id)
-            print(cap)
-            receipt = pg.process(request)
-            print(f"[{receipt.method}] {receipt.status.upper()} {receipt.amount} {receipt.currency} :: {receipt.message} (id={receipt.payment_id})")
-            print("Credit Card Payment Successful.")
-        elif pm == "3":
-            amt = float(input("Enter Amount: "))
-            request = PaymentRequest(
-                method="banktransfer",
-                amount=amt,
-                currency="NZD",
-                metadata={"iban": "123-459-786"} # will be different for each payment method.
-            )
-            processor = PaymentFactory.create(request.method, request.amount, request.currency, request.metadata)
-            auth = processor.authorize()
-            print(auth)
-            cap = processor.capture(auth.payment_id)
-            print(cap)
-            print("Bank Transfer Payment Successful.")
-        elif pm == "4":
-            amt = float(input("Enter Amount: "))
-            request = PaymentRequest(
-                method="paypal",          # aliases like "creditcard", "credit_card" also work
-                amount=amt,
-                currency="NZD",
-                metadata={"paypal_account": "paypal@account.com"}
-            )
-            processor = PaymentFactory.create(request.method, request.amount, request.currency, request.metadata)
-            auth = processor.authorize()
-            print(auth)
-            cap = processor.capture(auth.payment_id)
-            print(cap)
-            receipt = pg.process(request)
-            print(f"[{receipt.method}] {receipt.status.upper()} {receipt.amount} {receipt.currency} :: {receipt.message} (id={receipt.payment_id})")
-            print("Paypal Payment Successful.")
-        elif pm == "5":
-            amt = float(input("Enter Amount: "))
-            request = PaymentRequest(
-                method="crypto",          # aliases like "creditcard", "credit_card" also work
-                amount=amt,
-                currency="NZD",
-                metadata={"walletaddr": "becd-opop-9089-oiui"}
-            )
-            processor = PaymentFactory.create(request.method, request.amount, request.currency, request.metadata)
-            auth = processor.authorize()
-            print(auth)
-            cap = processor.capture(auth.payment_id)
-            print(cap)
-            receipt = pg.process(request)
-            print(f"[{receipt.method}] {receipt.status.upper()} {receipt.amount} {receipt.currency} :: {receipt.message} (id={receipt.payment_id})")
-            print("Crypto Payment Successful.")
-        elif pm == "6":
-            amt = float(input("Enter Amount: "))
-            request = PaymentRequest(
-                method="googlepay",          # aliases like "creditcard", "credit_card" also work
-                amount=amt,
-                currency="NZD",
-                metadata={"gpay_token": "user@gmail.com"}
-            )
-            processor = PaymentFactory.create(request.method, request.amount, request.currency, request.metadata)
-            auth = processor.authorize()
-            print(auth)
-            cap = processor.capture(auth.payment_id)
-            print(cap)
-            receipt = pg.process(request)
-            print(f"[{receipt.method}] {receipt.status.upper()} {receipt.amount} {receipt.currency} :: {receipt.message} (id={receipt.payment_id})")
-            print("Google Pay Payment Successful.")
+        handler = HANDLERS.get(pm)
+        if handler:
+            handler(pg)
         else:
             print("\nTransaction Cancelled!\n")
             break
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,3 @@
-import matplotlib.pyplot as plt
-
 def get_cmplx_no():
     cmplx_no = input(f"Enter a Complex Number:")
     return complex(cmplx_no)
@@ -7,64 +5,90 @@ def get_cmplx_no():
 def cmplx_add (cmplx_no1,cmplx_no2):
     """Add complex numbers (cmplx_no1 = a + bi, cmplx_no2 = c + di)."""
     # (a + bi) + (c + di) = (a + c) + (b + d)i
-    real_no = cmplx_no1.real + cmplx_no2.real
-    imag_no = cmplx_no1.imag + cmplx_no2.imag
-
-    return complex(real_no, imag_no)
+    return cmplx_no1 + cmplx_no2
 
 def cmplx_multiply (cmplx_no1,cmplx_no2):
     """Multiply  complex numbers (cmplx_no1 = a + bi, cmplx_no2 = c + di)."""
     # (a + bi) * (c + di) = (ac - bd) + (ad + bc)i
-    real_part = (cmplx_no1.real * cmplx_no2.real) - (cmplx_no1.imag * cmplx_no2.imag)
-    imag_part = (cmplx_no1.real * cmplx_no2.imag) + (cmplx_no1.imag * cmplx_no2.real)
-    return complex(real_part, imag_part)
+    return cmplx_no1 * cmplx_no2
 
 def cmplx_minus (cmplx_no1, cmplx_no2):
     """Subtract complex numbers (cmplx_no1 = a + bi, cmplx_no2 = c + di)."""
     # (a + bi) - (c + di) = (a - c) + (b - d)i
-    real_part = cmplx_no1.real - cmplx_no2.real
-    imag_part = cmplx_no1.imag - cmplx_no2.imag
-    return complex(real_part, imag_part)
+    return cmplx_no1 - cmplx_no2
 
 def cmplx_divide(cmplx_no1, cmplx_no2):
     """Divides two complex numbers (z1 = a + bi, z2 = c + di). Handles division by zero."""
     # (a + bi) / (c + di) = [(ac + bd) / (c^2 + d^2)] + [(bc - ad) / (c^2 + d^2)]i
-    cmplx_no2_squared = (cmplx_no2.real**2 + cmplx_no2.imag**2)
-
-    if cmplx_no2_squared == 0:
+    try:
+        return cmplx_no1 / cmplx_no2
+    except ZeroDivisionError:
         return "Cannot divide by zero!"
 
-    real_part = ((cmplx_no1.real * cmplx_no2.real) + (cmplx_no1.imag * cmplx_no2.imag)) / cmplx_no2_squared
-    imag_part = ((cmplx_no1.imag * cmplx_no2.real) - (cmplx_no1.real * cmplx_no2.imag)) / cmplx_no2_squared
-    return complex(real_part, imag_part)
+def _as_cmplx_arr(cmplx_no1, cmplx_no2):
+    """Turns both operands into complex128 arrays of the same shape."""
+    # numpy, like matplotlib, is only imported once a batch helper is used
+    import numpy as np
+    return np.broadcast_arrays(np.asarray(cmplx_no1, dtype=np.complex128),
+                               np.asarray(cmplx_no2, dtype=np.complex128))
+
+def cmplx_add_vec(cmplx_no1, cmplx_no2):
+    """Adds two batches of complex numbers element by element."""
+    cmplx_no1, cmplx_no2 = _as_cmplx_arr(cmplx_no1, cmplx_no2)
+    return cmplx_no1 + cmplx_no2
+
+def cmplx_multiply_vec(cmplx_no1, cmplx_no2):
+    """Multiplies two batches of complex numbers element by element."""
+    cmplx_no1, cmplx_no2 = _as_cmplx_arr(cmplx_no1, cmplx_no2)
+    return cmplx_no1 * cmplx_no2
+
+def cmplx_minus_vec(cmplx_no1, cmplx_no2):
+    """Subtracts two batches of complex numbers element by element."""
+    cmplx_no1, cmplx_no2 = _as_cmplx_arr(cmplx_no1, cmplx_no2)
+    return cmplx_no1 - cmplx_no2
+
+def cmplx_divide_vec(cmplx_no1, cmplx_no2):
+    """Divides two batches of complex numbers element by element.
+    Where the divisor is zero the result is left as nan instead of raising."""
+    import numpy as np
+    cmplx_no1, cmplx_no2 = _as_cmplx_arr(cmplx_no1, cmplx_no2)
+    quotient = np.full(cmplx_no1.shape, np.nan, dtype=np.complex128)
+    return np.divide(cmplx_no1, cmplx_no2, out=quotient, where=(cmplx_no2 != 0))
 
 def plot_cmplx_no(cmplx_no, titles):
     """
     Prints a list of complex numbers and their coordinates, simulating a text-based plot.
     
     Args:
-        complex_numbers (list): A list of complex numbers.
+        cmplx_no (np.ndarray): complex128 array of the numbers (lists are converted).
         titles (list): A list of titles for each complex number.
     """
+    # Imported here so the arithmetic helpers load without pulling in numpy or matplotlib
+    import numpy as np
+    import matplotlib.pyplot as plt
+    from matplotlib.lines import Line2D
+
+    arr = np.asarray(cmplx_no, dtype=np.complex128)
+    # Extract real and imaginary parts
+    xs = arr.real
+    ys = arr.imag
     print("\n--- Complex Number Coordinates ---")
     print("{:<15} {:<10} {:<10}".format("Title", "Real (X)", "Imaginary (Y)"))
     print("-" * 45)
-    for i, z in enumerate(cmplx_no):
-        # Extract real and imaginary parts
-        x = z.real
-        y = z.imag
-        print("{:<15} {:<10.2f} {:<10.2f}".format(titles[i], x, y))
+    print("\n".join("{:<15} {:<10.2f} {:<10.2f}".format(title, x, y)
+                    for title, (x, y) in zip(titles, np.column_stack((xs, ys)))))
     print("----------------------------------\n")
 
     plt.figure(figsize=(8, 8))
-    for i, z in enumerate(cmplx_no):
-        # Extract real and imaginary parts
-        x = z.real
-        y = z.imag
-        # Plot the point
-        plt.plot(x, y, 'o', label=f'{titles[i]}: ({x:.2f} + {y:.2f}j)')
+    colors = [f"C{i % 10}" for i in range(len(arr))]
+    # Plot every point as one collection
+    plt.scatter(xs, ys, c=colors)
+    handles = []
+    for title, x, y, color in zip(titles, xs, ys, colors):
         # Add annotation
-        plt.annotate(titles[i], (x, y), textcoords="offset points", xytext=(5,5), ha='center')
+        plt.annotate(title, (x, y), textcoords="offset points", xytext=(5,5), ha='center')
+        handles.append(Line2D([], [], marker='o', linestyle='', color=color,
+                              label=f'{title}: ({x:.2f} + {y:.2f}j)'))
 
     plt.xlabel("Real Axis")
     plt.ylabel("Imaginary Axis")
@@ -72,11 +96,12 @@ def plot_cmplx_no(cmplx_no, titles):
     plt.grid(True)
     plt.axhline(0, color='black',linewidth=0.5)
     plt.axvline(0, color='black',linewidth=0.5)
-    plt.legend()
+    plt.legend(handles=handles)
     plt.show()  
 
 
 def main():
+    import numpy as np
     cmplx_no1=get_cmplx_no()
     cmplx_no2=get_cmplx_no()
     cmplx_sum=cmplx_add(cmplx_no1,cmplx_no2)
@@ -86,7 +111,10 @@ def main():
 
     print(cmplx_no1,cmplx_no2,cmplx_sum,cmplx_product,cmplx_diff,cmplx_quotient)
 
-    cmplx_to_plot = [cmplx_no1, cmplx_no2, cmplx_sum, cmplx_product, cmplx_diff, cmplx_quotient]
+    # Stored once as complex128 so .real/.imag are plain float arrays for plotting.
+    # The quotient comes from the vector divide, which gives nan (not plotted) for a zero divisor.
+    cmplx_to_plot = np.array([cmplx_no1, cmplx_no2, cmplx_sum, cmplx_product, cmplx_diff,
+                              cmplx_divide_vec(cmplx_no1, cmplx_no2)], dtype=np.complex128)
     titles_for_plot = ["cmplx_no1", "cmplx_no2", "cmplx_no1 + cmplx_no2", "cmplx_no1 * cmplx_no2", "cmplx_no1 - cmplx_no2", "cmplx_no1 / cmplx_no2"]
 
     # Plot the results